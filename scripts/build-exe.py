@@ -19,6 +19,10 @@ if __name__ == "__main__":
             "pacsanini",
             "--add-data",
             f"{prefect_config}:prefect",
+            # CLI sub-commands are imported lazily and cannot be
+            # discovered by analyzing the import statements.
+            "--collect-submodules",
+            "pacsanini",
             "src/pacsanini/__main__.py",
         ]
     )
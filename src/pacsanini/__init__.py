@@ -2,7 +2,16 @@
 # All rights reserved.
 # This file is subject to the terms and conditions described in the
 # LICENSE file distributed in this package.
-"""Expose the top-level pacsanini methods and classes."""
+"""Expose the top-level pacsanini methods and classes.
+
+The exposed names are only imported from their submodules when they are
+first accessed so that importing pacsanini (eg: to run the command line)
+does not load the networking, io, and parsing dependencies up front.
+"""
+import importlib
+
+from typing import Any, List
+
 
 __all__ = [
     "parse_dir",
@@ -32,28 +41,45 @@ __all__ = [
 ]
 
 from pacsanini.__version__ import __version__
-from pacsanini.io import parse_dir, parse_dir2csv, parse_dir2df, parse_dir2json
-from pacsanini.net import (
-    StoreSCPServer,
-    echo,
-    find,
-    move,
-    move_patients,
-    move_studies,
-    patient_find,
-    patient_find2csv,
-    patient_find2sql,
-    run_server,
-    send_dicom,
-    study_find,
-    study_find2csv,
-    study_find2sql,
-)
-from pacsanini.parse import (
-    DicomTag,
-    DicomTagGroup,
-    get_dicom_tag_value,
-    get_tag_value,
-    parse_dicom,
-    parse_dicoms,
-)
+
+
+_LAZY_ATTRIBUTES = {
+    "parse_dir": "pacsanini.io",
+    "parse_dir2csv": "pacsanini.io",
+    "parse_dir2df": "pacsanini.io",
+    "parse_dir2json": "pacsanini.io",
+    "StoreSCPServer": "pacsanini.net",
+    "echo": "pacsanini.net",
+    "find": "pacsanini.net",
+    "move": "pacsanini.net",
+    "move_patients": "pacsanini.net",
+    "move_studies": "pacsanini.net",
+    "patient_find": "pacsanini.net",
+    "patient_find2csv": "pacsanini.net",
+    "patient_find2sql": "pacsanini.net",
+    "run_server": "pacsanini.net",
+    "send_dicom": "pacsanini.net",
+    "study_find": "pacsanini.net",
+    "study_find2csv": "pacsanini.net",
+    "study_find2sql": "pacsanini.net",
+    "DicomTag": "pacsanini.parse",
+    "DicomTagGroup": "pacsanini.parse",
+    "get_dicom_tag_value": "pacsanini.parse",
+    "get_tag_value": "pacsanini.parse",
+    "parse_dicom": "pacsanini.parse",
+    "parse_dicoms": "pacsanini.parse",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
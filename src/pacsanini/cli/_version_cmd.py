@@ -0,0 +1,19 @@
+# Copyright (C) 2019-2020, Therapixel SA.
+# All rights reserved.
+# This file is subject to the terms and conditions described in the
+# LICENSE file distributed in this package.
+"""Expose the --version callback of the pacsanini entry point. This
+module should only import the package's version so that printing it
+does not load any of the sub-commands' dependencies.
+"""
+from click import echo
+
+from pacsanini.__version__ import __version__
+
+
+def print_version(ctx, param, value):  # pylint: disable=unused-argument
+    """Print the program's version."""
+    if not value or ctx.resilient_parsing:
+        return
+    echo(f"Version {__version__}")
+    ctx.exit()
@@ -5,17 +5,39 @@
 """Expose custom click classes to enable prettier help messages
 from the command line.
 """
+import importlib
 import os
+import sys
 
-from collections import OrderedDict
+from collections import defaultdict
+from functools import lru_cache
 from typing import Callable
 
-from click import UNPROCESSED, BadParameter, Command, Option, option
+import yaml
+
+from click import (
+    UNPROCESSED,
+    BadParameter,
+    ClickException,
+    Command,
+    Group,
+    Option,
+    option,
+)
 
 from pacsanini.config import DEFAULT_CONFIG_NAME, PACSANINI_CONF_ENVVAR, PacsaniniConfig
 from pacsanini.utils import default_config_path
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore
+
+
+GROUP_OTHER = sys.intern("Other Options")
+
+
 class GroupOption(Option):
     """GroupOption enables users to group command options
     by adding the "help_group" kwarg to the @click.option
@@ -34,59 +56,142 @@ class GroupCommand(Command):
 
     def format_options(self, ctx, formatter):
         """Write all the options in the formatter if they exist."""
-        opts = OrderedDict()
+        opts = defaultdict(list)
 
         for param in self.get_params(ctx):
             retval = param.get_help_record(ctx)
             if retval is not None:
-                if hasattr(param, "help_group") and param.help_group:
-                    opts.setdefault(str(param.help_group), []).append(retval)
-                else:
-                    opts.setdefault("Other Options", []).append(retval)
+                help_group = getattr(param, "help_group", None)
+                key = sys.intern(str(help_group)) if help_group else GROUP_OTHER
+                opts[key].append(retval)
 
         for name, opts_group in opts.items():
             with formatter.section(name):
                 formatter.write_dl(opts_group)
 
 
-def config_option(function: Callable) -> Callable:
-    """Return the configuration option that is used in most commands."""
+class LazyGroup(Group):
+    """The LazyGroup class registers sub-commands by their import
+    path so that a sub-command's module is only imported when the
+    sub-command is used. Lazy sub-commands are declared with the
+    "lazy_subcommands" kwarg as a mapping of command names to
+    "<module>:<command>" import paths.
+    """
 
-    def validate_path(ctx, param, value):
-        if not value:
-            value = default_config_path()
-            if not value:
-                msg = (
-                    "No configuration file provided and no default"
-                    " configuration file in the following locations:\n"
-                    f" (1) Using the {PACSANINI_CONF_ENVVAR} env var,\n"
-                    f" (2) Using a {DEFAULT_CONFIG_NAME} file in your current dir,\n"
-                    f" (3) Using the {DEFAULT_CONFIG_NAME} file in your homedir."
-                )
-                raise BadParameter(msg, ctx=ctx, param=param)
-
-        if not os.path.exists(value):
-            raise BadParameter(f"'{value}' does not exist")
-
-        ext = value.rsplit(".", 1)[-1].lower()
-        load_func = (
-            PacsaniniConfig.from_json if ext == "json" else PacsaniniConfig.from_yaml
+    def __init__(self, *args, **kwargs):
+        self.lazy_subcommands = kwargs.pop("lazy_subcommands", {})
+        super().__init__(*args, **kwargs)
+
+    def list_commands(self, ctx):
+        """Return the names of the eager and lazy sub-commands."""
+        commands = super().list_commands(ctx)
+        return sorted(set(commands).union(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        """Return the sub-command, importing it first if it is lazy."""
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, cmd_attr = self.lazy_subcommands[cmd_name].split(":", 1)
+        module = importlib.import_module(module_name)
+        return getattr(module, cmd_attr)
+
+
+def _config_from_yaml(path: str) -> PacsaniniConfig:
+    with open(path) as in_:
+        content = yaml.load(in_, Loader=SafeLoader)
+    return PacsaniniConfig(**content)
+
+
+_LOADERS = {
+    "json": PacsaniniConfig.from_json,
+    "yaml": _config_from_yaml,
+    "yml": _config_from_yaml,
+}
+
+
+def _ext(path: str) -> str:
+    return os.path.splitext(path)[1][1:].lower()
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime: float) -> PacsaniniConfig:
+    """Load the configuration file found at the given absolute path.
+    The file's modification time is part of the cache key so that an
+    edited file is reloaded instead of being served from the cache.
+    """
+    # pylint: disable=unused-argument
+    return _LOADERS[_ext(path)](path)
+
+
+def load_pacsanini_config(path: str) -> PacsaniniConfig:
+    """Load a pacsanini configuration file from a JSON or YAML file.
+    Loaded configurations are cached in memory for as long as the file
+    is not modified: the same instance is returned to every caller, who
+    should therefore not modify it.
+
+    Parameters
+    ----------
+    path : str
+        The path to the configuration file.
+
+    Returns
+    -------
+    PacsaniniConfig
+        The loaded configuration.
+
+    Raises
+    ------
+    ClickException
+        A ClickException is raised if the file's extension is not
+        one of json, yaml, or yml.
+    """
+    if _ext(path) not in _LOADERS:
+        raise ClickException(
+            f"'{path}' must be a JSON (.json) or YAML (.yaml, .yml) file."
         )
-        pacsanini_config = load_func(value)
-        return pacsanini_config
+    return _load_config_cached(os.path.abspath(path), os.path.getmtime(path))
+
+
+_CONFIG_HELP = (
+    "The pacsanini configuration file to use. The order of evaluation is:"
+    " (1) the value you explicitely provided,\n"
+    f" (2) the value provided by the {PACSANINI_CONF_ENVVAR} env var,\n"
+    f" (3) a file named {DEFAULT_CONFIG_NAME} in your current directory,\n"
+    f" (4) a file named {DEFAULT_CONFIG_NAME} in your home directory.\n"
+)
+
 
+def validate_path(ctx, param, value):
+    """Load the configuration file passed to the config option
+    or, if it is unset, the default configuration file.
+    """
+    if not value:
+        value = default_config_path()
+        if not value:
+            msg = (
+                "No configuration file provided and no default"
+                " configuration file in the following locations:\n"
+                f" (1) Using the {PACSANINI_CONF_ENVVAR} env var,\n"
+                f" (2) Using a {DEFAULT_CONFIG_NAME} file in your current dir,\n"
+                f" (3) Using the {DEFAULT_CONFIG_NAME} file in your homedir."
+            )
+            raise BadParameter(msg, ctx=ctx, param=param)
+
+    if not os.path.exists(value):
+        raise BadParameter(f"'{value}' does not exist")
+
+    return load_pacsanini_config(value)
+
+
+def config_option(function: Callable) -> Callable:
+    """Return the configuration option that is used in most commands."""
     function = option(
         "-f",
         "--config",
         required=False,
         type=UNPROCESSED,
         callback=validate_path,
-        help=(
-            "The pacsanini configuration file to use. The order of evaluation is:"
-            " (1) the value you explicitely provided,\n"
-            f" (2) the value provided by the {PACSANINI_CONF_ENVVAR} env var,\n"
-            f" (3) a file named {DEFAULT_CONFIG_NAME} in your current directory,\n"
-            f" (4) a file named {DEFAULT_CONFIG_NAME} in your home directory.\n"
-        ),
+        help=_CONFIG_HELP,
     )(function)
     return function
@@ -5,26 +5,29 @@
 """The commands module exposes the different command lines methods
 that can be used with pacsanini.
 """
-from click import echo, group, option
+from click import group, option
 
-from pacsanini.__version__ import __version__
-from pacsanini.cli.config import config_cli
-from pacsanini.cli.dashboard import dashboard_cli
-from pacsanini.cli.db import db_cli_group
-from pacsanini.cli.net import echo_cli, find_cli, move_cli, send_cli, server_cli
-from pacsanini.cli.parse import gen_parser, parse
-from pacsanini.cli.pipeline import orchestrate_cli
+from pacsanini.cli._version_cmd import print_version
+from pacsanini.cli.base import LazyGroup
 
 
-def print_version(ctx, param, value):  # pylint: disable=unused-argument
-    """Print the program's version."""
-    if not value or ctx.resilient_parsing:
-        return
-    echo(f"Version {__version__}")
-    ctx.exit()
-
-
-@group(name="pacsanini")
+@group(
+    name="pacsanini",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "config": "pacsanini.cli.config:config_cli",
+        "dashboard": "pacsanini.cli.dashboard:dashboard_cli",
+        "db": "pacsanini.cli.db:db_cli_group",
+        "echo": "pacsanini.cli.net:echo_cli",
+        "find": "pacsanini.cli.net:find_cli",
+        "move": "pacsanini.cli.net:move_cli",
+        "send": "pacsanini.cli.net:send_cli",
+        "server": "pacsanini.cli.net:server_cli",
+        "parse": "pacsanini.cli.parse:parse",
+        "parse-conf": "pacsanini.cli.parse:gen_parser",
+        "orchestrate": "pacsanini.cli.pipeline:orchestrate_cli",
+    },
+)
 @option(
     "--version", is_flag=True, callback=print_version, expose_value=False, is_eager=True
 )
@@ -32,16 +35,3 @@ def entry_point(**kwargs):
     """Parse or configure your DICOM tag parsing capabilities
     from the command line.
     """
-
-
-entry_point.add_command(config_cli)
-entry_point.add_command(dashboard_cli)
-entry_point.add_command(db_cli_group)
-entry_point.add_command(echo_cli)
-entry_point.add_command(find_cli)
-entry_point.add_command(move_cli)
-entry_point.add_command(send_cli)
-entry_point.add_command(server_cli)
-entry_point.add_command(parse)
-entry_point.add_command(gen_parser)
-entry_point.add_command(orchestrate_cli)
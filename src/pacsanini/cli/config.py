@@ -6,6 +6,7 @@
 import json
 import os
 
+from copy import deepcopy
 from datetime import datetime
 
 import click
@@ -13,10 +14,38 @@ import yaml
 
 from pacsanini.config import PacsaniniConfig
 from pacsanini.convert import datetime2str
-from pacsanini.parse import DicomTag
 from pacsanini.utils import default_config_path
 
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper  # type: ignore
+
+
+_CONFIG_TEMPLATE = {
+    "move": {"start_time": None, "end_time": None, "query_level": "PATIENT"},
+    "net": {
+        "local_node": {"aetitle": "pacsanini_config"},
+        "called_node": {
+            "aetitle": "pacsanini_config",
+            "ip": "localhost",
+            "port": 11112,
+        },
+    },
+    "find": {
+        "query_level": "PATIENT",
+        "search_fields": ["PatientName", "StudyInstanceUID"],
+        "modality": "",
+    },
+    "storage": {"sort_by": "PATIENT"},
+    "tags": [
+        {"tag_name": ["SOPInstanceUID"], "tag_alias": "image_uid"},
+        {"tag_name": ["Laterality", "ImageLaterality"], "tag_alias": "laterality"},
+    ],
+}
+
+
 def _datetime_encoder(val):
     if isinstance(val, datetime):
         return datetime2str(val)
@@ -24,7 +53,7 @@ def _datetime_encoder(val):
 
 
 @click.command("config")
-@click.argument("conf", required=False, default=default_config_path())
+@click.argument("conf", required=False, default=default_config_path)
 @click.option(
     "--fmt",
     type=click.Choice(["json", "yaml"]),
@@ -53,36 +82,17 @@ def config_cli(conf: str, fmt: str, edit: bool):
         click.launch(conf)
         return
 
-    config = PacsaniniConfig(
-        move={"start_time": None, "end_time": None, "query_level": "PATIENT"},
-        net={
-            "local_node": {"aetitle": "pacsanini_config"},
-            "called_node": {
-                "aetitle": "pacsanini_config",
-                "ip": "localhost",
-                "port": 11112,
-            },
-        },
-        find={
-            "query_level": "PATIENT",
-            "search_fields": ["PatientName", "StudyInstanceUID"],
-            "start_date": datetime.now().strftime("%Y%m%d"),
-            "end_date": datetime.now().strftime("%Y%m%d"),
-            "modality": "",
-        },
-        storage={
-            "resources": os.path.join(os.getcwd(), "resources.csv"),
-            "resources_meta": os.path.join(os.getcwd(), "resources_meta.csv"),
-            "directory": os.getcwd(),
-            "sort_by": "PATIENT",
-        },
-        tags=[
-            DicomTag(tag_name=["SOPInstanceUID"], tag_alias="image_uid"),
-            DicomTag(
-                tag_name=["Laterality", "ImageLaterality"], tag_alias="laterality"
-            ),
-        ],
+    today = datetime.now().strftime("%Y%m%d")
+    cwd = os.getcwd()
+
+    template = deepcopy(_CONFIG_TEMPLATE)
+    template["find"].update(start_date=today, end_date=today)
+    template["storage"].update(
+        resources=os.path.join(cwd, "resources.csv"),
+        resources_meta=os.path.join(cwd, "resources_meta.csv"),
+        directory=cwd,
     )
+    config = PacsaniniConfig(**template)
     config_dict = config.dict(
         exclude={
             "net": {
@@ -100,4 +110,4 @@ def config_cli(conf: str, fmt: str, edit: bool):
             json.dump(config_dict, out, indent=4, default=_datetime_encoder)
     else:
         with open(conf, "w") as out:
-            yaml.safe_dump(config_dict, out)
+            yaml.dump(config_dict, out, Dumper=SafeDumper)
@@ -3,11 +3,11 @@
 # This file is subject to the terms and conditions described in the
 # LICENSE file distributed in this package.
 """Expose the commands needed to spawn the dashboard server."""
+# pylint: disable=import-outside-toplevel
 import click
 
 from pacsanini.cli.base import config_option
 from pacsanini.config import PacsaniniConfig
-from pacsanini.dashboard.app import run_server
 
 
 @click.command(name="dashboard")
@@ -30,4 +30,6 @@ def dashboard_cli(config: PacsaniniConfig, port: int, debug: bool):
     """Launch the pacsanini dashboard. This only works if the
     pacsanini backend is a sql database.
     """
+    from pacsanini.dashboard.app import run_server
+
     run_server(config, port=port, debug=debug)
@@ -85,10 +85,17 @@ def upgrade_cli(config: PacsaniniConfig, dry_run: bool):
         " The default is all tables."
     ),
 )
-def dump_cli(config: PacsaniniConfig, output: str, table: List[str]):
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="The number of rows to fetch and write at a time when dumping tables.",
+)
+def dump_cli(config: PacsaniniConfig, output: str, table: List[str], chunk_size: int):
     """Dump pacsanini database tables in CSV format."""
     with get_db_session(config.storage.resources) as session:
-        dump_database(session, output=output, tables=table)
+        dump_database(session, output=output, tables=table, chunk_size=chunk_size)
 
 
 @click.group(name="db")
@@ -96,6 +103,5 @@ def db_cli_group():
     """Perform database related commands."""
 
 
-db_cli_group.add_command(init_cli)
-db_cli_group.add_command(dump_cli)
-db_cli_group.add_command(upgrade_cli)
+for _cmd in (init_cli, dump_cli, upgrade_cli):
+    db_cli_group.add_command(_cmd)
@@ -2,37 +2,152 @@
 # All rights reserved.
 # This file is subject to the terms and conditions described in the
 # LICENSE file distributed in this package.
-"""Use pacsanini's network functionalities from the command line."""
-import click
+"""Use pacsanini's network functionalities from the command line.
+
+The networking and database dependencies are imported by the commands
+that use them so that loading the module (eg: to display the CLI's
+help) stays fast.
+"""
+# pylint: disable=import-outside-toplevel
+import ctypes
+import logging
+import queue
+import sys
 
-from pynetdicom import debug_logger
-from sqlalchemy import create_engine, exc
-from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
+from threading import Event, Thread
+from time import monotonic
+from typing import Generator, Iterable, TypeVar
+
+import click
 
 from pacsanini.cli.base import GroupCommand, config_option
 from pacsanini.config import PacsaniniConfig
-from pacsanini.db.crud import get_study_uids_to_move
 from pacsanini.models import QueryLevel
-from pacsanini.net import (
-    echo,
-    move_patients,
-    move_studies,
-    patient_find2csv,
-    run_server,
-    send_dicom,
-    study_find2csv,
-)
-from pacsanini.net.c_find import patient_find2sql, study_find2sql
 from pacsanini.utils import is_db_uri, read_resources
 
 
+T = TypeVar("T")
+
+
+def _silence_pynetdicom():
+    """Only let warnings and errors from pynetdicom and pydicom through.
+    The debug messages emitted for every PDU are then discarded by the
+    loggers' level check before reaching any handler.
+    """
+    for name in ("pynetdicom", "pydicom"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+
+def _iter_in_thread(
+    iterable: Iterable[T], maxsize: int = 1024
+) -> Generator[T, None, None]:
+    """Consume an iterable in a background thread and yield its items
+    from the calling thread. This lets the network operations that
+    produce the items carry on while the caller handles the previous
+    ones. Exceptions raised by the iterable are re-raised in the
+    calling thread once the items produced before it are yielded.
+    If the caller stops early, the background thread stops consuming
+    the iterable and closes it.
+    """
+    items: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = Event()
+    sentinel = object()
+    errors = []
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def drain():
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put(item):
+                    break
+        except BaseException as err:  # pylint: disable=broad-except
+            errors.append(err)
+        finally:
+            # Generators must be closed by the thread that runs them.
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            put(sentinel)
+
+    thread = Thread(target=drain, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is sentinel:
+                break
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+@contextmanager
+def _timer_resolution(period_ms: int = 1):
+    """On Windows, request a timer resolution of period_ms milliseconds
+    for the duration of the context. The default resolution (~15ms)
+    otherwise adds latency to each of pynetdicom's polling sleeps.
+    This is a no-op on other platforms.
+    """
+    if sys.platform != "win32":
+        yield
+        return
+
+    winmm = ctypes.WinDLL("winmm")  # type: ignore
+    winmm.timeBeginPeriod(period_ms)
+    try:
+        yield
+    finally:
+        winmm.timeEndPeriod(period_ms)
+
+
+def _echo_buffered(
+    lines: Iterable[str], max_lines: int = 256, flush_interval: float = 1.0
+):
+    """Echo lines to the standard output in bulk. Lines are written
+    once max_lines lines are buffered or once flush_interval seconds
+    have elapsed since the last write, whichever comes first, so that
+    slow producers still have their output displayed promptly.
+    """
+    buffer = []
+    last_flush = monotonic()
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= max_lines or monotonic() - last_flush >= flush_interval:
+            click.echo("\n".join(buffer))
+            buffer.clear()
+            last_flush = monotonic()
+
+    if buffer:
+        click.echo("\n".join(buffer))
+
+
 @click.command(name="echo")
 @config_option
 @click.option("--debug", is_flag=True, help="If set, print debug messages.")
 def echo_cli(config: PacsaniniConfig, debug: bool):
     """Test your connection with an another DICOM node over a network."""
+    from pynetdicom import debug_logger
+
+    from pacsanini.net import echo
+
     if debug:
         debug_logger()
+    else:
+        _silence_pynetdicom()
 
     return echo(config.net.local_node, config.net.called_node)
 
@@ -45,14 +160,41 @@ def echo_cli(config: PacsaniniConfig, debug: bool):
     default=False,
     help="If set, create the database tables before parsing results.",
 )
+@click.option(
+    "--relational-queries/--no-relational-queries",
+    default=False,
+    show_default=True,
+    help=(
+        "Propose relational queries to the called node. Only use this with nodes"
+        " that are known to handle relational queries correctly."
+    ),
+)
 @click.option("--debug", is_flag=True, help="If set, print debug messages.")
-def find_cli(config: PacsaniniConfig, create_tables: bool, debug: bool):
+def find_cli(
+    config: PacsaniniConfig, create_tables: bool, relational_queries: bool, debug: bool
+):
     """Emit C-FIND requests to the called node as specified by
     the config file. Results will be written to the output file
     specified by the "resources" setting in the configuration file.
     """
+    if "find" not in config.capabilities:
+        raise click.ClickException(
+            "The provided configuration file is not configured for find operations."
+        )
+
+    from pynetdicom import debug_logger
+
+    from pacsanini.net import (
+        patient_find2csv,
+        patient_find2sql,
+        study_find2csv,
+        study_find2sql,
+    )
+
     if debug:
         debug_logger()
+    else:
+        _silence_pynetdicom()
 
     dest = config.storage.resources
     if is_db_uri(dest):
@@ -69,6 +211,7 @@ def find_cli(config: PacsaniniConfig, create_tables: bool, debug: bool):
             end_date=config.find.end_date,
             modality=config.find.modality,
             create_tables=create_tables,
+            relational=relational_queries,
         )
     else:
         find_func_csv = (
@@ -84,6 +227,7 @@ def find_cli(config: PacsaniniConfig, create_tables: bool, debug: bool):
             start_date=config.find.start_date,
             end_date=config.find.end_date,
             modality=config.find.modality,
+            relational=relational_queries,
         )
 
 
@@ -94,66 +238,81 @@ def move_cli(config: PacsaniniConfig, debug: bool):
     """Move the DICOM resources specified by the resources parameter in the
     configuration file.
     """
-    if not config.can_move():
+    if "move" not in config.capabilities:
         raise click.ClickException(
             "The provided configuration file is not configured for move operations."
         )
 
+    from pynetdicom import debug_logger
+    from sqlalchemy.orm import sessionmaker
+
+    from pacsanini.db import engines
+    from pacsanini.db.crud import iter_study_uids_to_move
+    from pacsanini.net import move_patients, move_studies
+
     if debug:
         debug_logger()
+    else:
+        _silence_pynetdicom()
 
-    query_level = config.move.query_level
+    net_config, storage, move_config = config.net, config.storage, config.move
+    dest = storage.resources
 
-    engine = None
     db_session = None
-    dest = config.storage.resources
+    resources_session = None
+    resources: Iterable[str]
 
     try:
         if is_db_uri(dest):
-            if dest.lower().startswith("sqlite"):
-                connect_args = {"check_same_thread": False}
-            else:
-                connect_args = None
-
-            engine = create_engine(dest, connect_args=connect_args)
-            DBSsession = sessionmaker(bind=engine)
+            engine = engines.get_or_create(dest, **engines.default_kwargs(dest))
+            DBSsession = sessionmaker(
+                bind=engine, expire_on_commit=False, autoflush=False
+            )
+            # Resources are read in the background thread that runs the
+            # move while the storescp server records the received files:
+            # each gets its own session.
             db_session = DBSsession()
-            resources = get_study_uids_to_move(db_session)
+            resources_session = DBSsession()
+            resources = iter_study_uids_to_move(resources_session)
         else:
-            resources = read_resources(
-                config.storage.resources, config.move.query_level
-            )
+            resources = read_resources(dest, move_config.query_level)
 
-        if query_level == "patient":
+        # Resources read from a database are always study UIDs.
+        if db_session is None and move_config.query_level == QueryLevel.PATIENT:
             move_func = move_patients(
-                config.net.local_node,
-                config.net.called_node,
+                net_config.local_node,
+                net_config.called_node,
                 patient_ids=resources,
-                dest_node=config.net.dest_node,
-                directory=config.storage.directory,
-                sort_by=config.storage.sort_by,
-                start_time=config.move.start_time,
-                end_time=config.move.end_time,
+                dest_node=net_config.dest_node,
+                directory=storage.directory,
+                sort_by=storage.sort_by,
+                start_time=move_config.start_time,
+                end_time=move_config.end_time,
                 db_session=db_session,
             )
         else:
             move_func = move_studies(
-                config.net.local_node,
-                config.net.called_node,
+                net_config.local_node,
+                net_config.called_node,
                 study_uids=resources,
-                dest_node=config.net.dest_node,
-                directory=config.storage.directory,
-                sort_by=config.storage.sort_by,
-                start_time=config.move.start_time,
-                end_time=config.move.end_time,
+                dest_node=net_config.dest_node,
+                directory=storage.directory,
+                sort_by=storage.sort_by,
+                start_time=move_config.start_time,
+                end_time=move_config.end_time,
                 db_session=db_session,
             )
 
-        for (status, resource) in move_func:
-            click.echo(f"Move status for {resource}: {status}")
-    except exc.SQLAlchemyError:
-        db_session.close()
-        engine.dispose()
+        with _timer_resolution():
+            _echo_buffered(
+                f"Move status for {resource}: {status}"
+                for (status, resource) in _iter_in_thread(move_func)
+            )
+    finally:
+        if resources_session is not None:
+            resources_session.close()
+        if db_session is not None:
+            db_session.close()
 
 
 @click.command(name="send")
@@ -163,15 +322,25 @@ def move_cli(config: PacsaniniConfig, debug: bool):
 def send_cli(dcmdir: str, config: PacsaniniConfig, debug: bool):
     """Send a DICOM or a DICOM directory by specifying the DCMDIR argument
     from your local node to a destination node using C-STORE operations.
+    All the DICOM files are sent over a single association.
     """
+    from pynetdicom import debug_logger
+
+    from pacsanini.net import send_dicom
+
     if debug:
         debug_logger()
+    else:
+        _silence_pynetdicom()
 
     results = send_dicom(
         dcmdir, src_node=config.net.local_node, dest_node=config.net.called_node
     )
-    for (path, status) in results:
-        click.echo(f"{path},{'OK' if status.Status == 0 else 'FAILED'}")
+    with _timer_resolution():
+        _echo_buffered(
+            f"{path},{'OK' if status.Status == 0 else 'FAILED'}"
+            for (path, status) in _iter_in_thread(results)
+        )
 
 
 @click.command(name="server")
@@ -179,12 +348,19 @@ def send_cli(dcmdir: str, config: PacsaniniConfig, debug: bool):
 @click.option("--debug", is_flag=True, help="If set, print debug messages.")
 def server_cli(config: PacsaniniConfig, debug: bool):
     """Start a DICOM storescp server in the current process."""
+    from pynetdicom import debug_logger
+
+    from pacsanini.net import run_server
+
     if debug:
         debug_logger()
+    else:
+        _silence_pynetdicom()
 
-    run_server(
-        config.net.dest_node,
-        data_dir=config.storage.directory,
-        sort_by=config.storage.sort_by,
-        block=True,
-    )
+    with _timer_resolution():
+        run_server(
+            config.net.dest_node,
+            data_dir=config.storage.directory,
+            sort_by=config.storage.sort_by,
+            block=True,
+        )
@@ -5,19 +5,42 @@
 """The parse module exposes DICOM tag parsing functionalities to the
 command line.
 """
+# pylint: disable=import-outside-toplevel
 import json
 import os
 import sys
 
 import yaml
 
-from click import Choice, ClickException, Path, command, confirm, echo, option, prompt
+from click import (
+    Choice,
+    ClickException,
+    IntRange,
+    Path,
+    command,
+    confirm,
+    echo,
+    option,
+    prompt,
+)
 
 from pacsanini.cli.base import GroupCommand, GroupOption, config_option
 from pacsanini.config import PacsaniniConfig
-from pacsanini.db import parse_dir2sql
 from pacsanini.errors import ConfigFormatError
-from pacsanini.io import parse_dir2csv, parse_dir2json
+
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
+
+def _yaml_load(stream):
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+_TAG_LOADERS = {"json": json.load, "yaml": _yaml_load}
 
 
 @command(name="parse", cls=GroupCommand)
@@ -89,6 +112,69 @@ from pacsanini.io import parse_dir2csv, parse_dir2json
     help_group="Runtime options",
     help="The number of threads to use.",
 )
+@option(
+    "-p",
+    "--procs",
+    cls=GroupOption,
+    type=IntRange(min=0),
+    default=0,
+    show_default=True,
+    help_group="Runtime options",
+    help=(
+        "If greater than 0, the number of processes to use instead of threads"
+        " for the csv and json formats."
+    ),
+)
+@option(
+    "--stop-before-pixels/--full-read",
+    cls=GroupOption,
+    default=True,
+    show_default=True,
+    help_group="Runtime options",
+    help="Stop reading DICOM files before their pixel data (csv and json formats).",
+)
+@option(
+    "--specific-tags/--all-tags",
+    cls=GroupOption,
+    default=True,
+    show_default=True,
+    help_group="Runtime options",
+    help=(
+        "Only read the DICOM tags that are configured to be parsed"
+        " (csv and json formats)."
+    ),
+)
+@option(
+    "--sql-batch",
+    cls=GroupOption,
+    type=IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help_group="Runtime options",
+    help="The number of rows sent per statement for bulk SQL inserts (sql format).",
+)
+@option(
+    "--store-meta/--no-store-meta",
+    cls=GroupOption,
+    default=True,
+    show_default=True,
+    help_group="Runtime options",
+    help=(
+        "Store all the DICOM tags (pixel data excluded) in JSON format"
+        " along with the basic tag columns (sql format)."
+    ),
+)
+@option(
+    "--sqlite-wal",
+    cls=GroupOption,
+    is_flag=True,
+    default=False,
+    help_group="Runtime options",
+    help=(
+        "Switch SQLite databases to write-ahead logging before inserting"
+        " results. The setting persists in the database file (sql format)."
+    ),
+)
 @option(
     "--create-tables",
     is_flag=True,
@@ -107,12 +193,26 @@ def parse(
     institution_name: str,
     mode: str,
     threads: int,
+    procs: int,
+    stop_before_pixels: bool,
+    specific_tags: bool,
+    sql_batch: int,
+    store_meta: bool,
+    sqlite_wal: bool,
     create_tables: bool,
 ):
     """Parse DICOM tags using the tags configuration file for the specified
     DICOM files and write the results to the output destination. Configuration
     files can be obtained using the parse-conf command.
     """
+    from pacsanini.db import parse_dir2sql
+    from pacsanini.io import parse_dir2csv, parse_dir2json
+
+    if fmt != "sql" and "parse" not in config.capabilities:
+        raise ClickException(
+            "The provided configuration file does not specify any tags to parse."
+        )
+
     parser = config.get_tags()
 
     if fmt == "csv":
@@ -123,6 +223,9 @@ def parse(
             nb_threads=threads,
             include_path=include_path,
             mode=mode if output else "w",
+            nb_procs=procs,
+            stop_before_pixels=stop_before_pixels,
+            specific_tags=specific_tags,
         )
     elif fmt == "json":
         parse_dir2json(
@@ -131,6 +234,9 @@ def parse(
             output if output else sys.stdout,
             nb_threads=threads,
             include_path=include_path,
+            nb_procs=procs,
+            stop_before_pixels=stop_before_pixels,
+            specific_tags=specific_tags,
         )
     else:
         parse_dir2sql(
@@ -139,6 +245,9 @@ def parse(
             institution_name=institution_name,
             nb_threads=threads,
             create_tables=create_tables,
+            batch_size=sql_batch,
+            store_meta=store_meta,
+            wal=sqlite_wal,
         )
 
 
@@ -216,10 +325,9 @@ def gen_parser(output: str, fmt: str):
     tags_conf = {"tags": tags}
     if output:
         if os.path.exists(output):
-            load_func = json.load if fmt == "json" else yaml.load
             try:
                 with open(output) as in_:
-                    new_conf = load_func(in_)  # type: ignore
+                    new_conf = _TAG_LOADERS[fmt](in_)
             except (json.JSONDecodeError, yaml.YAMLError):
                 raise ConfigFormatError(
                     f"{output} was expected to be in {fmt} format but is invalid."
@@ -232,9 +340,13 @@ def gen_parser(output: str, fmt: str):
             if fmt == "json":
                 json.dump(new_conf, out, indent=4)
             else:
-                yaml.dump(new_conf, out, indent=4)
+                yaml.dump(new_conf, out, indent=4, Dumper=SafeDumper)
     else:
         if fmt == "json":
             echo(json.dumps(tags_conf, indent=4))
         else:
-            echo(yaml.dump(tags_conf, indent=4, default_flow_style=False))
+            echo(
+                yaml.dump(
+                    tags_conf, indent=4, default_flow_style=False, Dumper=SafeDumper
+                )
+            )
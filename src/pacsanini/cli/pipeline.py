@@ -3,11 +3,11 @@
 # This file is subject to the terms and conditions described in the
 # LICENSE file distributed in this package.
 """Expose the complete collection pipeline from the CLI."""
+# pylint: disable=import-outside-toplevel
 import click
 
 from pacsanini.cli.base import config_option
 from pacsanini.config import PacsaniniConfig
-from pacsanini.pipeline import run_pacsanini_pipeline
 
 
 @click.command(name="orchestrate")
@@ -27,6 +27,27 @@ from pacsanini.pipeline import run_pacsanini_pipeline
     show_default=True,
     help="If --init-db is set and the results backend is a database: create the database.",
 )
-def orchestrate_cli(config: PacsaniniConfig, threads: int, init_db: bool):
+@click.option(
+    "--inline/--staged",
+    default=False,
+    show_default=True,
+    help=(
+        "If --inline is set, keep found resources in memory and move them once the"
+        " search completes instead of storing them in the resources backend first."
+        " Inline runs cannot be resumed."
+    ),
+)
+def orchestrate_cli(config: PacsaniniConfig, threads: int, init_db: bool, inline: bool):
     """Run the find-move-parse pipeline orchestrated by pacsanini."""
+    if inline:
+        from pacsanini.pipeline import run_pacsanini_pipeline_inline
+
+        for status, uid in run_pacsanini_pipeline_inline(
+            config, nb_threads=threads, init_db=init_db
+        ):
+            click.echo(f"Move status for {uid}: {status}")
+        return
+
+    from pacsanini.pipeline import run_pacsanini_pipeline
+
     run_pacsanini_pipeline(config, nb_threads=threads, init_db=init_db)
@@ -8,18 +8,24 @@ pacsanini package is configured.
 import json
 import os
 
-from datetime import datetime, time, timedelta
-from typing import List, Optional, Union
+from datetime import datetime, time
+from typing import FrozenSet, List, Optional, Union
 
 import yaml
 
-from pydantic import BaseModel, root_validator, validator
+from pydantic import BaseModel, Field, root_validator, validator
 
 from pacsanini.convert import datetime2str, str2datetime
 from pacsanini.models import DicomNode, QueryLevel, StorageSortKey
 from pacsanini.parse import DicomTag, DicomTagGroup
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore
+
+
 DEFAULT_CONFIG_NAME = "pacsaninirc.yaml"
 DEFAULT_SETTINGS_PATH = os.path.join(os.path.expanduser("~"), DEFAULT_CONFIG_NAME)
 PACSANINI_CONF_ENVVAR = "PACSANINI_CONFIG"
@@ -115,32 +121,12 @@ class MoveConfig(BaseModel):
         if self.start_time is None or self.end_time is None:
             return True
 
-        now = self.now()
-        today = now - timedelta(
-            hours=now.hour,
-            minutes=now.minute,
-            seconds=now.second,
-            microseconds=now.microsecond,
-        )
-        start_td = timedelta(
-            hours=self.start_time.hour,
-            minutes=self.start_time.minute,
-            seconds=self.start_time.second,
-            microseconds=self.start_time.microsecond,
-        )
-        end_td = timedelta(
-            hours=self.end_time.hour,
-            minutes=self.end_time.minute,
-            seconds=self.end_time.second,
-            microseconds=self.end_time.microsecond,
-        )
-
+        # Times of the same day compare like the datetimes they belong to.
+        current = self.now().time()
         if self.end_time > self.start_time:
-            upper_limit = today + end_td
-            lower_limit = today + start_td
-            return lower_limit < now < upper_limit
+            return self.start_time < current < self.end_time
 
-        return now > (today + start_td) or now < (today + end_td)
+        return current > self.start_time or current < self.end_time
 
     def now(self) -> datetime:
         """Return the current datetime."""
@@ -286,7 +272,7 @@ class PacsaniniConfig(BaseModel):
     net: Optional[NetConfig] = None
     storage: Optional[StorageConfig] = None
     tags: Optional[List[DicomTag]] = None
-    email: Optional[EmailConfig] = EmailConfig()
+    email: Optional[EmailConfig] = Field(default_factory=EmailConfig.construct)
 
     @classmethod
     def from_json(cls, path: str):
@@ -299,7 +285,7 @@ class PacsaniniConfig(BaseModel):
     def from_yaml(cls, path: str):
         """Obtain a PacsaniniConfig instance from a yaml file."""
         with open(path) as in_:
-            content = yaml.safe_load(in_.read())
+            content = yaml.load(in_, Loader=SafeLoader)
         return cls(**content)
 
     def can_find(self) -> bool:
@@ -320,10 +306,23 @@ class PacsaniniConfig(BaseModel):
         """Returns True if the tags config is not None -False otherwise."""
         return self.tags is not None
 
+    @property
+    def capabilities(self) -> FrozenSet[str]:
+        """The operations that the configuration is set for: any of
+        "find", "move", and "parse".
+        """
+        checks = (
+            ("find", self.can_find),
+            ("move", self.can_move),
+            ("parse", self.can_parse),
+        )
+        return frozenset(name for name, check in checks if check())
+
     def get_tags(self) -> Union[DicomTagGroup, None]:
         """Return the DICOMTagGroup instance associated
         with the current configuration.
         """
         if self.tags is None:
             return None
-        return DicomTagGroup(tags=[tag_grp.dict() for tag_grp in self.tags])
+        # The tags are already validated DicomTag instances.
+        return DicomTagGroup.construct(tags=list(self.tags))
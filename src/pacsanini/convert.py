@@ -5,15 +5,18 @@
 """The convert module provides utility methods that can be used
 to convert raw DICOM data to DICOM files.
 """
-import json
-import re
-
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Union
 
 from pydicom import Dataset, dcmread
 
 
+def _is_digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+@lru_cache(maxsize=4096)
 def str2datetime(dcm_date: str) -> datetime:
     """Parse a date in DICOM string format and return
     a datetime object.
@@ -39,18 +42,23 @@ def str2datetime(dcm_date: str) -> datetime:
         A ValueError is raised if the dcm_date parameter
         does not conform to any DICOM date(time) format.
     """
-    fmt = "%Y%m%d"
-    try:
-        return datetime.strptime(dcm_date, fmt)
-    except ValueError:
-        fmt += "%H%M%S.%f"
-        try:
-            return datetime.strptime(dcm_date, fmt)
-        except ValueError:
-            fmt += "%z"
-            return datetime.strptime(dcm_date, fmt)
+    # Plain dates are built directly: strptime has to match the value
+    # against a regex generated from the format on every call.
+    if len(dcm_date) == 8 and _is_digits(dcm_date):
+        return datetime(int(dcm_date[:4]), int(dcm_date[4:6]), int(dcm_date[6:]))
+
+    # Pick the only format that can match rather than trying each
+    # format in turn and catching the resulting errors.
+    if "." not in dcm_date:
+        fmt = "%Y%m%d"
+    elif dcm_date.rpartition(".")[2].isdigit():
+        fmt = "%Y%m%d%H%M%S.%f"
+    else:
+        fmt = "%Y%m%d%H%M%S.%f%z"
+    return datetime.strptime(dcm_date, fmt)
 
 
+@lru_cache(maxsize=4096)
 def str2timedelta(dcm_time: str) -> timedelta:
     """Parse a time in DICOM string value and return a
     timedelta object.
@@ -75,22 +83,24 @@ def str2timedelta(dcm_time: str) -> timedelta:
         A ValueError is raised if the dcm_time parameter
         does not conform to the DICOM time format.
     """
-    m = re.fullmatch(
-        r"(\d\d)(?:(\d\d)(?:(\d\d)(?:\.(\d{1,6}))?)?)?", dcm_time, flags=re.ASCII
-    )
-
-    if m is None:
+    hhmmss, sep, fraction = dcm_time.partition(".")
+    valid = len(hhmmss) in (2, 4, 6) and _is_digits(hhmmss)
+    if sep:
+        valid = (
+            valid
+            and len(hhmmss) == 6
+            and 0 < len(fraction) <= 6
+            and _is_digits(fraction)
+        )
+    if not valid:
         raise ValueError(f"Invalid DICOM time string: '{dcm_time}'")
 
-    time_vals = {"hours": int(m.group(1))}
-    if m.group(2) is not None:
-        time_vals["minutes"] = int(m.group(2))
-        if m.group(3) is not None:
-            time_vals["seconds"] = int(m.group(3))
-            if m.group(4) is not None:
-                time_vals["microseconds"] = int(m.group(4).ljust(6, "0"))
-
-    return timedelta(**time_vals)
+    return timedelta(
+        hours=int(hhmmss[:2]),
+        minutes=int(hhmmss[2:4] or 0),
+        seconds=int(hhmmss[4:6] or 0),
+        microseconds=int(fraction.ljust(6, "0")) if fraction else 0,
+    )
 
 
 def datetime2str(date_time: datetime, use_time: bool = False) -> str:
@@ -110,11 +120,8 @@ def datetime2str(date_time: datetime, use_time: bool = False) -> str:
     str
         The datetime object as a DICOM string.
     """
-    omit_time = (
-        date_time.hour == 0
-        and date_time.minute == 0
-        and date_time.second == 0
-        and date_time.microsecond == 0
+    omit_time = not (
+        date_time.hour | date_time.minute | date_time.second | date_time.microsecond
     )
 
     if use_time or not omit_time:
@@ -141,6 +148,11 @@ def timedelta2str(time_delta: timedelta) -> str:
     return ref_date.strftime("%H%M%S.%f")
 
 
+# The number of age string units in a year, by unit.
+_AGE_DIV = {"D": 365, "W": 52, "M": 12, "Y": 1, "d": 365, "w": 52, "m": 12, "y": 1}
+
+
+@lru_cache(maxsize=4096)
 def agestr2years(age_str: str) -> int:
     """Convert an Age String into a int where the age unit is
     in years. Expected formats are: nnnD, nnnW, nnnM, nnnY.
@@ -171,25 +183,27 @@ def agestr2years(age_str: str) -> int:
         raise ValueError(
             f"Expected the age string to be in the 'nnn[DWMY]' format. Obtained: {age_str}"
         )
-    age_unit = age_str[-1].upper()
-    if age_unit not in "DWMY":
+    try:
+        divisor = _AGE_DIV[age_str[3]]
+    except KeyError:
         raise ValueError(
-            f"Expected the age string unit to be one of 'D', 'W', 'M', 'Y'. Obtained: {age_unit}"
-        )
+            f"Expected the age string unit to be one of 'D', 'W', 'M', 'Y'. Obtained: {age_str[3].upper()}"
+        ) from None
+
+    return int(age_str[:3]) // divisor
 
-    age_value = age_str[:3]
-    if age_unit == "D":
-        return int(age_value) // 365
-    elif age_unit == "W":
-        return int(age_value) // 52
-    elif age_unit == "M":
-        return int(age_value) // 12
-    else:
-        return int(age_value)
+
+@lru_cache(maxsize=8192)
+def _name_for_tag(raw_name: str) -> str:
+    # str.title() is not used as it also capitalizes letters that
+    # follow apostrophes and hyphens (eg: "Patient'S Name").
+    name = raw_name.replace("[", "").replace("]", "")
+    return "".join(word.capitalize() for word in name.split(" "))
 
 
 def dcm2dict(
-    dcm: Union[Dataset, bytes, str], include_pixels: bool = False
+    dcm: Union[Dataset, bytes, str],
+    include_pixels: bool = False,
 ) -> Dict[str, dict]:
     """Return the JSON-compatiable dict representation of a DICOM file.
 
@@ -212,23 +226,16 @@ def dcm2dict(
     if not include_pixels:
         dcm.PixelData = None
 
-    def tag2name(dcm: Dataset, tag: str) -> str:
-        name = dcm[tag].name.replace("[", "").replace("]", "")
-        name = "".join(char.capitalize() for char in name.split(" "))
-        return name
-
-    def dict2nameddict(dcm: Dataset, seq_dict: Dict[str, dict]):
-        for key, value in seq_dict.items():
-            value["Name"] = tag2name(dcm, key)
-            if value["vr"] == "SQ" and len(value["Value"]):
-                value["Value"][0] = dict2nameddict(dcm[key][0], value["Value"][0])
-        return seq_dict
-
     dcm_dict = dcm.to_json_dict()
-    for key, value in dcm_dict.items():
-        value["Name"] = tag2name(dcm, key)
-        if value["vr"] == "SQ" and len(value["Value"]):
-            value["Value"][0] = dict2nameddict(dcm[key][0], value["Value"][0])
+    # Only the first item of each sequence is named, as before. Walking
+    # the nested datasets with a stack avoids a function call per level.
+    stack = [(dcm, dcm_dict)]
+    while stack:
+        dataset, seq_dict = stack.pop()
+        for key, value in seq_dict.items():
+            value["Name"] = _name_for_tag(dataset[key].name)
+            if value["vr"] == "SQ" and value.get("Value"):
+                stack.append((dataset[key][0], value["Value"][0]))
     return dcm_dict
 
 
@@ -249,4 +256,6 @@ def dict2dcm(dcm_dict: Dict[str, dict]) -> Dataset:
     for values in dcm_dict.values():
         values.pop("Name", None)
 
-    return Dataset.from_json(json.dumps(dcm_dict))
+    # from_json accepts the dict as is: serializing it to a JSON string
+    # first would only have it parsed back into the same dict.
+    return Dataset.from_json(dcm_dict)
@@ -6,21 +6,21 @@
 import os
 
 from datetime import date, datetime
-from typing import Any
+from functools import lru_cache
+from time import monotonic
+from typing import Any, List, Optional, Tuple
 
 import dash
-import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 
 from dash import dcc, html
 from dash.dependencies import Input, Output
-from sqlalchemy import and_, create_engine
+from sqlalchemy import Integer, and_, cast, distinct, extract, func, select
 from sqlalchemy.orm import sessionmaker
 
 from pacsanini.config import PacsaniniConfig
 from pacsanini.dashboard.env import app_env
-from pacsanini.db import ManufacturerView, StudyMetaView
+from pacsanini.db import ManufacturerView, StudyMetaView, engines
 
 
 base_path = os.path.dirname(os.path.abspath(__file__))
@@ -152,45 +152,28 @@ def counts_card() -> html.Div:
     )
 
 
-def generate_study_metadata_plot(data: pd.DataFrame) -> Any:
-    """Recompute and return the bar plot."""
-    data["study_year"] = data["study_date"].apply(lambda x: x.year)
+# The study year, manufacturer, and patient, study, and image counts
+# of a bar in the bar plot.
+YearlyCounts = Tuple[int, str, int, int, int]
 
-    year_grp = data.groupby(["study_year", "manufacturer"])
-    yearly_patients = year_grp["patient_id"].nunique().reset_index()
-    yearly_studies = year_grp["study_uid"].nunique().reset_index()
-    yearly_images = year_grp["image_count"].sum().reset_index()
-    years = yearly_images["study_year"]
+# The name and color of the bar plot traces, in the order in which
+# they are drawn.
+_BAR_TRACES = (("patients", "#DA9422"), ("studies", "#22D892"), ("images", "#9222D8"))
 
+
+def study_metadata_figure() -> go.Figure:
+    """Return the bar plot with one empty trace per count type."""
     fig = go.Figure(
         data=[
             go.Bar(
-                name="patients",
-                x=years,
-                y=yearly_patients["patient_id"],
+                name=name,
+                x=[],
+                y=[],
                 textposition="none",
-                text=yearly_studies["manufacturer"],
-                hovertemplate="%{x} %{text} patients: %{y}",
-                marker_color="#DA9422",
-            ),
-            go.Bar(
-                name="studies",
-                x=years,
-                y=yearly_studies["study_uid"],
-                textposition="none",
-                text=yearly_studies["manufacturer"],
-                hovertemplate="%{x} %{text} studies: %{y}",
-                marker_color="#22D892",
-            ),
-            go.Bar(
-                name="images",
-                x=years,
-                y=yearly_images["image_count"],
-                textposition="none",
-                text=yearly_images["manufacturer"],
-                hovertemplate="%{x} %{text} images: %{y}",
-                marker_color="#9222D8",
-            ),
+                hovertemplate=f"%{{x}} %{{text}} {name}: %{{y}}",
+                marker_color=color,
+            )
+            for name, color in _BAR_TRACES
         ]
     )
 
@@ -200,34 +183,139 @@ def generate_study_metadata_plot(data: pd.DataFrame) -> Any:
         barmode="group",
         xaxis_title="year",
         yaxis_title="counts",
-        xaxis=dict(tick0=data["study_year"].min(), dtick=1),
+        xaxis=dict(dtick=1),
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)",
     )
     return fig
 
 
+def generate_study_metadata_plot(yearly_counts: List[YearlyCounts]) -> go.Figure:
+    """Recompute the bar plot from the (year, manufacturer, patients,
+    studies, images) counts, ordered by year.
+    """
+    if yearly_counts:
+        years, manufacturers, *counts = (list(col) for col in zip(*yearly_counts))
+    else:
+        years, manufacturers, counts = [], [], [[] for _ in _BAR_TRACES]
+    tick0 = years[0] if years else None
+
+    fig = study_metadata_figure()
+    for trace, values in zip(fig.data, counts):
+        trace.update(x=years, y=values, text=manufacturers)
+    fig.update_layout(xaxis=dict(tick0=tick0, dtick=1))
+    return fig
+
+
+# The figure without values shown when a page is loaded. It is built
+# once and only updated by the browser afterwards.
+_INITIAL_FIGURE = study_metadata_figure()
+
+
 def graph_card() -> html.Div:
-    """Return an empty bar plot that will be initialized on startup."""
-    fig = px.bar()
-    return html.Div(children=[dcc.Graph(id="data-overview", figure=fig)])
+    """Return the bar plot, without values, that will be filled on startup."""
+    return html.Div(children=[dcc.Graph(id="data-overview", figure=_INITIAL_FIGURE)])
 
 
-@app.callback(
-    Output("manufacturer-select", "options"), Input("control-card", "children")
-)
-def load_manufacturer_options(_):
-    """Load the different available manufacturers on application startup."""
-    if not app_env.manufacturers:
-        DBSession = sessionmaker(bind=app_env.engine)
-        session = DBSession()
-        available_manufacturers = [
-            res[0] for res in session.query(ManufacturerView.manufacturer).all()
-        ]
-        app_env.manufacturers = available_manufacturers
-    else:
-        available_manufacturers = app_env.manufacturers
-    return [{"label": manu, "value": manu} for manu in available_manufacturers]
+def _query_manufacturers() -> List[str]:
+    """Return the distinct manufacturers found in the database."""
+    query = select(ManufacturerView.manufacturer).distinct()
+    with app_env.Session() as session:
+        return session.execute(query).scalars().all()
+
+
+def _range_filter(column: Any, lower: int, upper: int) -> Any:
+    """Return the predicate that selects the column values within a range
+    slider's bounds. A lower bound of 0 is treated as no lower bound.
+    """
+    if lower == upper:
+        return column == upper
+    if lower == 0:
+        return column <= upper
+    return column.between(lower, upper)
+
+
+# The number of seconds during which query results are reused.
+_CACHE_TIMEOUT = 300
+
+
+def query_study_counts(
+    manufacturers: Tuple[str, ...],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    image_range: Tuple[int, int],
+    patient_age: Tuple[int, int],
+) -> Tuple[int, int, int, List[YearlyCounts]]:
+    """Return the patient, study, and image counts of the studies that
+    match the filters, along with the same counts per study year and
+    manufacturer.
+
+    Results are cached by filter values for at most _CACHE_TIMEOUT
+    seconds so that counts do not go stale while data is ingested.
+    """
+    period = int(monotonic() // _CACHE_TIMEOUT)
+    return _query_study_counts(
+        manufacturers, start_date, end_date, image_range, patient_age, period
+    )
+
+
+@lru_cache(maxsize=128)
+def _query_study_counts(
+    manufacturers: Tuple[str, ...],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    image_range: Tuple[int, int],
+    patient_age: Tuple[int, int],
+    period: int,
+) -> Tuple[int, int, int, List[YearlyCounts]]:
+    """Run the queries of query_study_counts. The period is part of the
+    cache key so that results expire once it changes.
+    """
+    # pylint: disable=unused-argument
+    filters = []
+
+    if manufacturers:
+        filters.append(StudyMetaView.manufacturer.in_(manufacturers))
+
+    if start_date and end_date:
+        filters.append(
+            StudyMetaView.study_date.between(
+                date.fromisoformat(start_date), date.fromisoformat(end_date)
+            )
+        )
+    elif start_date:
+        filters.append(StudyMetaView.study_date >= date.fromisoformat(start_date))
+    elif end_date:
+        filters.append(StudyMetaView.study_date <= date.fromisoformat(end_date))
+
+    filters.append(_range_filter(StudyMetaView.patient_age, *patient_age))
+    filters.append(_range_filter(StudyMetaView.image_count, *image_range))
+    where_clause = and_(*filters)
+
+    patient_count = func.count(distinct(StudyMetaView.patient_id))
+    study_count = func.count(distinct(StudyMetaView.study_uid))
+    image_count = func.coalesce(func.sum(StudyMetaView.image_count), 0)
+    totals_query = select(patient_count, study_count, image_count).where(where_clause)
+
+    # Studies without a study date have no year to be counted under.
+    study_year = cast(extract("year", StudyMetaView.study_date), Integer)
+    yearly_query = (
+        select(
+            study_year.label("study_year"),
+            StudyMetaView.manufacturer,
+            patient_count.label("patients"),
+            study_count.label("studies"),
+            image_count.label("images"),
+        )
+        .where(where_clause, StudyMetaView.study_date.isnot(None))
+        .group_by(study_year, StudyMetaView.manufacturer)
+        .order_by(study_year, StudyMetaView.manufacturer)
+    )
+
+    with app_env.engine.connect() as conn:
+        patients, studies, images = conn.execute(totals_query).one()
+        yearly_counts = [tuple(row) for row in conn.execute(yearly_query)]
+    return patients, studies, images, yearly_counts
 
 
 @app.callback(
@@ -249,84 +337,52 @@ def update_query_results(manufacturer, start_date, end_date, image_range, patien
     """Update the patient, study, and image counts based on the provided
     control card input values. Regenerate the graph as well.
     """
-    DBSession = sessionmaker(bind=app_env.engine)
-    session = DBSession()
-    query = session.query(StudyMetaView)
+    if isinstance(manufacturer, str):
+        manufacturer = [manufacturer]
+    patients, studies, images, yearly_counts = query_study_counts(
+        tuple(sorted(manufacturer or ())),
+        start_date,
+        end_date,
+        tuple(image_range),
+        tuple(patient_age),
+    )
 
-    if manufacturer:
-        if isinstance(manufacturer, str):
-            query = query.filter(StudyMetaView.manufacturer == manufacturer)
-        else:
-            query = query.filter(StudyMetaView.manufacturer.in_(manufacturer))
+    return (
+        f"{patients:,}",
+        f"{studies:,}",
+        f"{images:,}",
+        generate_study_metadata_plot(yearly_counts),
+    )
 
-    if start_date and end_date:
-        start_date_obj = date.fromisoformat(start_date)
-        end_date_obj = date.fromisoformat(end_date)
-        query = query.filter(
-            and_(
-                StudyMetaView.study_date >= start_date_obj,
-                StudyMetaView.study_date <= end_date_obj,
-            )
-        )
-    elif start_date:
-        start_date_obj = date.fromisoformat(start_date)
-        query = query.filter(StudyMetaView.study_date >= start_date_obj)
-    elif end_date:
-        end_date_obj = date.fromisoformat(end_date)
-        query = query.filter(StudyMetaView.study_date <= end_date_obj)
-
-    patient_age_lower = patient_age[0]
-    patient_age_upper = patient_age[1]
-    if patient_age_lower == patient_age_upper:
-        query = query.filter(StudyMetaView.patient_age == patient_age_upper)
-    elif patient_age_lower == 0:
-        query = query.filter(StudyMetaView.patient_age <= patient_age_upper)
-    else:
-        query = query.filter(
-            and_(
-                StudyMetaView.patient_age >= patient_age_lower,
-                StudyMetaView.patient_age <= patient_age_upper,
-            )
-        )
 
-    image_count_lower = image_range[0]
-    image_count_upper = image_range[1]
-    if image_count_lower == image_count_upper:
-        query = query.filter(StudyMetaView.image_count == image_count_upper)
-    elif image_count_lower == 0:
-        query = query.filter(StudyMetaView.image_count <= image_count_upper)
-    else:
-        query = query.filter(
-            and_(
-                StudyMetaView.image_count >= image_count_lower,
-                StudyMetaView.image_count <= image_count_upper,
-            )
-        )
+# The description and the graphs do not depend on the database or on
+# the date: they are built once and shared by every page load.
+_DESCRIPTION_CARD = description_card()
+_RIGHT_COLUMN = html.Div(
+    id="right-column",
+    className="eight columns",
+    children=[counts_card(), graph_card()],
+)
 
-    results = pd.read_sql_query(query.statement, app_env.engine.connect())
 
-    return (
-        f'{results["patient_id"].nunique():,}',
-        f'{results["study_uid"].nunique():,}',
-        f'{results["image_count"].sum():,}',
-        generate_study_metadata_plot(results),
+def serve_layout() -> html.Div:
+    """Return the dashboard's layout. Only the control card is built
+    when a page is loaded so that the manufacturer dropdown lists the
+    manufacturers queried when the server was started.
+    """
+    return html.Div(
+        children=[
+            html.Div(
+                id="left-column",
+                className="four columns",
+                children=[_DESCRIPTION_CARD, control_card()],
+            ),
+            _RIGHT_COLUMN,
+        ]
     )
 
 
-app.layout = html.Div(
-    children=[
-        html.Div(
-            id="left-column",
-            className="four columns",
-            children=[description_card(), control_card()],
-        ),
-        html.Div(
-            id="right-column",
-            className="eight columns",
-            children=[counts_card(), graph_card()],
-        ),
-    ]
-)
+app.layout = serve_layout
 
 
 def run_server(config: PacsaniniConfig, port: int = 8050, debug: bool = False):
@@ -345,22 +401,11 @@ def run_server(config: PacsaniniConfig, port: int = 8050, debug: bool = False):
         Whether the launch the dashboard in debug mode or not. The default
         is False.
     """
-    engine = None
-    session = None
-    try:
-        engine = create_engine(config.storage.resources)
-        app_env.engine = engine
-
-        DBSession = sessionmaker(bind=app_env.engine)
-        session = DBSession()
-        available_manufacturers = [
-            res[0] for res in session.query(ManufacturerView.manufacturer).all()
-        ]
-        app_env.manufacturers = available_manufacturers
-
-        app.run_server(port=port, debug=debug)
-    finally:
-        if session:
-            session.close()
-        if engine:
-            engine.dispose()
+    db_uri = config.storage.resources
+    engine = engines.get_or_create(db_uri, **engines.default_kwargs(db_uri))
+    app_env.engine = engine
+    app_env.Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+    app_env.manufacturers = _query_manufacturers()
+
+    app.run_server(port=port, debug=debug)
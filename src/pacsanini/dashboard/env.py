@@ -6,6 +6,7 @@
 from typing import List
 
 from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
 
 
 class AppEnv:
@@ -14,6 +15,7 @@ class AppEnv:
     """
 
     engine: Engine = None
+    Session: sessionmaker = None
     manufacturers: List[str] = []
 
 
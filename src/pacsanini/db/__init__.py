@@ -9,8 +9,10 @@ from pacsanini.db.crud import (
     DBWrapper,
     add_found_study,
     add_image,
+    add_images,
     get_studies_to_move,
     get_study_uids_to_move,
+    iter_study_uids_to_move,
     update_retrieved_study,
 )
 from pacsanini.db.models import Base, Image, Patient, Series, Study, StudyFind
@@ -6,22 +6,24 @@
 single items (studies found from C-FIND requests or DICOM metadata) into a
 given database.
 """
+from collections import OrderedDict
 from datetime import datetime
-from functools import lru_cache
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from loguru import logger
 from pydicom import Dataset
-from sqlalchemy import create_engine, exc
-from sqlalchemy.engine import Engine
+from sqlalchemy import insert, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
 from pacsanini.config import PacsaniniConfig, StorageConfig
+from pacsanini.db import engines
 from pacsanini.db.dcm2model import dcm2dbmodels, dcm2study_finding
-from pacsanini.db.models import Image, Patient, Series, Study, StudyFind
+from pacsanini.db.models import Base, Image, Patient, Series, Study, StudyFind
 
 
-def add_found_study(session: Session, dcm: Dataset) -> Optional[StudyFind]:
+def add_found_study(session: Session, dcm: Dataset) -> Optional[int]:
     """Add study metadata to the database after a successfull C-FIND
     operation.
 
@@ -31,17 +33,110 @@ def add_found_study(session: Session, dcm: Dataset) -> Optional[StudyFind]:
         The retrieved Dataset instance resulting from a C-FIND operation.
     session : Session
         The database session.
+
+    Returns
+    -------
+    Optional[int]
+        The database id of the inserted StudyFind row. If the study was
+        already found, None is returned.
     """
     study_find = dcm2study_finding(dcm)
 
-    try:
-        session.add(study_find)
-        session.commit()
-    except exc.IntegrityError:
+    study_find_dbid = _insert_new(
+        session, StudyFind, "study_uid", _column_values(study_find)
+    )
+    if study_find_dbid is None:
         session.rollback()
         return None
-    else:
-        return study_find
+
+    session.commit()
+    return study_find_dbid
+
+
+# The column attribute names of the models that are inserted with Core
+# statements, computed once instead of walking each mapper per row.
+_COLUMN_KEYS = {
+    model: tuple(prop.key for prop in inspect(model).column_attrs)
+    for model in (Patient, Study, Series, Image, StudyFind)
+}
+
+
+def _column_values(instance: Base) -> Dict[str, Any]:
+    """Return the column values that were set on a model instance."""
+    values = instance.__dict__
+    return {key: values[key] for key in _COLUMN_KEYS[type(instance)] if key in values}
+
+
+def _insert_or_get_id(
+    session: Session, model: Type[Base], uid_column: str, values: Dict[str, Any]
+) -> int:
+    """Insert a row unless one with the same unique UID already exists and
+    return the row's id. Duplicates are resolved by the database with an
+    ON CONFLICT clause where it is supported instead of by catching
+    IntegrityError exceptions.
+    """
+    if values.get(uid_column) is None:
+        # NULL values never conflict: there is no existing row to look up.
+        return session.execute(insert(model).values(**values)).inserted_primary_key[0]
+
+    dialect = session.get_bind().dialect.name
+    id_query = select(model.id).where(getattr(model, uid_column) == values[uid_column])
+    if dialect == "postgresql":
+        stmt = postgresql.insert(model).values(**values)
+        stmt = stmt.on_conflict_do_nothing(index_elements=[uid_column])
+        dbid = session.execute(stmt.returning(model.id)).scalar()
+        if dbid is None:
+            dbid = session.execute(id_query).scalar_one()
+        return dbid
+
+    if dialect == "sqlite":
+        stmt = sqlite.insert(model).values(**values)
+        session.execute(stmt.on_conflict_do_nothing(index_elements=[uid_column]))
+        return session.execute(id_query).scalar_one()
+
+    dbid = session.execute(id_query).scalar()
+    if dbid is None:
+        result = session.execute(insert(model).values(**values))
+        dbid = result.inserted_primary_key[0]
+    return dbid
+
+
+def _insert_new(
+    session: Session, model: Type[Base], uid_column: str, values: Dict[str, Any]
+) -> Optional[int]:
+    """Insert a row and return its id. None is returned if a row with the
+    same unique UID already exists.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql.insert(model).values(**values)
+        stmt = stmt.on_conflict_do_nothing(index_elements=[uid_column])
+        return session.execute(stmt.returning(model.id)).scalar()
+
+    if dialect == "sqlite":
+        stmt = sqlite.insert(model).values(**values)
+        stmt = stmt.on_conflict_do_nothing(index_elements=[uid_column])
+        result = session.execute(stmt)
+        return result.inserted_primary_key[0] if result.rowcount else None
+
+    uid = values[uid_column]
+    exists_query = select(model.id).where(getattr(model, uid_column) == uid)
+    if uid is not None and session.execute(exists_query).scalar() is not None:
+        return None
+    return session.execute(insert(model).values(**values)).inserted_primary_key[0]
+
+
+# The maximum number of patient, study, and series ids that add_image
+# remembers per session.
+_ID_CACHE_SIZE = 4096
+
+
+def _get_id_cache(session: Session) -> "OrderedDict[Tuple[Type[Base], str], int]":
+    """Return the session's cache of database ids by model and UID. Images
+    of the same study share their patient, study, and series so the ids
+    of these rows only need to be resolved by the database once.
+    """
+    return session.info.setdefault("pacsanini_id_cache", OrderedDict())
 
 
 def add_image(
@@ -49,7 +144,8 @@ def add_image(
     dcm: Union[str, Dataset],
     institution: str = None,
     filepath: str = None,
-) -> Optional[Image]:
+    include_meta: bool = True,
+) -> Optional[int]:
     """Insert an image to the database. If the image belongs to a new patient, study, or
     series, the relevant tables will also be updated. If the image already exists in the
     database (based on the SOPInstanceUID), the transaction will be rolled back.
@@ -64,65 +160,212 @@ def add_image(
         The institution that the DICOM image belongs to. The default is None.
     filepath : str
         The DICOM image's filepath. The default is None.
+    include_meta : bool
+        If True, store the DICOM image's tags (without the pixel data)
+        in the image's meta column. The default is True.
 
     Returns
     -------
-    Image
-        The inserted Image object. If the insert was unsuccessfull, None
-        is returned.
+    Optional[int]
+        The database id of the inserted Image row. If the image already
+        exists, None is returned.
     """
     pat, study, series, image = dcm2dbmodels(
-        dcm, institution=institution, filepath=filepath
+        dcm, institution=institution, filepath=filepath, include_meta=include_meta
     )
 
-    try:
-        session.add(pat)
-        session.flush()
-        pat_dbid = pat.id
-    except exc.IntegrityError:
-        session.rollback()
-        pat_dbid = (
-            session.query(Patient.id)
-            .filter(Patient.patient_id == pat.patient_id)
-            .first()[0]
+    id_cache = _get_id_cache(session)
+    new_ids = []
+
+    def get_id(model: Type[Base], uid_column: str, instance: Base) -> int:
+        key = (model, getattr(instance, uid_column))
+        dbid = id_cache.get(key)
+        if dbid is not None:
+            id_cache.move_to_end(key)
+        else:
+            values = _column_values(instance)
+            dbid = _insert_or_get_id(session, model, uid_column, values)
+            if key[1] is not None:
+                new_ids.append((key, dbid))
+        return dbid
+
+    study.patient_id = get_id(Patient, "patient_id", pat)
+    series.study_id = get_id(Study, "study_uid", study)
+    image.series_id = get_id(Series, "series_uid", series)
+
+    image_dbid = _insert_new(session, Image, "image_uid", _column_values(image))
+    if image_dbid is None:
+        logger.warning(
+            f"{image} already exists in the database. Rolling back commit..."
         )
-
-    study.patient_id = pat_dbid
-    try:
-        session.add(study)
-        session.flush()
-        study_dbid = study.id
-    except exc.IntegrityError:
         session.rollback()
-        study_dbid = (
-            session.query(Study.id)
-            .filter(Study.study_uid == study.study_uid)
-            .first()[0]
-        )
+        return None
 
-    series.study_id = study_dbid
-    try:
-        session.add(series)
-        session.flush()
-        series_dbid = series.id
-    except exc.IntegrityError:
-        session.rollback()
-        series_dbid = (
-            session.query(Series.id)
-            .filter(Series.series_uid == series.series_uid)
-            .first()[0]
-        )
+    session.commit()
+    # Only cache ids once they are committed: a rollback could otherwise
+    # leave ids of rows that do not exist in the cache.
+    for key, dbid in new_ids:
+        id_cache[key] = dbid
+        id_cache.move_to_end(key)
+    while len(id_cache) > _ID_CACHE_SIZE:
+        id_cache.popitem(last=False)
 
-    image.series_id = series_dbid
-    try:
-        session.add(image)
-        session.commit()
-    except exc.IntegrityError:
-        logger.warning("{image} already exists in the database. Rolling back commit...")
-        session.rollback()
-        return None
+    return image_dbid
+
+
+# The maximum number of UIDs to put in a single IN clause.
+_IN_CLAUSE_SIZE = 500
+
+
+def _ids_by_uid(
+    session: Session, model: Type[Base], uid_column: str, uids: Iterable[str]
+) -> Dict[str, int]:
+    """Return the ids of the rows whose UID is one of the given UIDs."""
+    column = getattr(model, uid_column)
+    uids = list(uids)
+    ids = {}
+    for start in range(0, len(uids), _IN_CLAUSE_SIZE):
+        query = select(column, model.id).where(
+            column.in_(uids[start : start + _IN_CLAUSE_SIZE])
+        )
+        ids.update(session.execute(query).all())
+    return ids
+
+
+def _insert_missing(
+    session: Session, model: Type[Base], uid_column: str, rows: List[Dict[str, Any]]
+):
+    """Insert, in a single statement, the rows whose UID does not exist yet."""
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert_func = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert_func(model).on_conflict_do_nothing(index_elements=[uid_column])
     else:
-        return image
+        existing = _ids_by_uid(
+            session, model, uid_column, (r[uid_column] for r in rows)
+        )
+        rows = [row for row in rows if row[uid_column] not in existing]
+        stmt = insert(model)
+    if rows:
+        session.execute(stmt, rows)
+
+
+def _insert_many_returning_ids(
+    session: Session, model: Type[Base], uid_column: str, rows: List[Dict[str, Any]]
+) -> Dict[str, int]:
+    """Insert the rows whose UID does not exist yet and return the ids of
+    the new rows, from the insert itself, and of the existing rows
+    (PostgreSQL only). Rows must have distinct UIDs.
+    """
+    column = getattr(model, uid_column)
+    ids = {}
+    for start in range(0, len(rows), _IN_CLAUSE_SIZE):
+        stmt = postgresql.insert(model).values(rows[start : start + _IN_CLAUSE_SIZE])
+        stmt = stmt.on_conflict_do_nothing(index_elements=[uid_column])
+        ids.update(session.execute(stmt.returning(column, model.id)).all())
+
+    existing_uids = [row[uid_column] for row in rows if row[uid_column] not in ids]
+    if existing_uids:
+        ids.update(_ids_by_uid(session, model, uid_column, existing_uids))
+    return ids
+
+
+def _insert_many_or_get_ids(
+    session: Session, model: Type[Base], uid_column: str, rows: List[Dict[str, Any]]
+) -> List[int]:
+    """Insert the rows whose UID does not exist yet and return, for each row,
+    the id of the new or existing row.
+    """
+    ids: List[Optional[int]] = [None] * len(rows)
+    unique_rows: Dict[str, Dict[str, Any]] = {}
+    for idx, row in enumerate(rows):
+        if row.get(uid_column) is None:
+            ids[idx] = _insert_or_get_id(session, model, uid_column, row)
+        else:
+            unique_rows.setdefault(row[uid_column], row)
+
+    if unique_rows:
+        if session.get_bind().dialect.name == "postgresql":
+            id_map = _insert_many_returning_ids(
+                session, model, uid_column, list(unique_rows.values())
+            )
+        else:
+            _insert_missing(session, model, uid_column, list(unique_rows.values()))
+            id_map = _ids_by_uid(session, model, uid_column, unique_rows)
+        for idx, row in enumerate(rows):
+            if ids[idx] is None:
+                ids[idx] = id_map[row[uid_column]]
+    return ids
+
+
+def add_images(
+    session: Session,
+    dcms: Iterable[Union[str, Dataset, Tuple[Union[str, Dataset], str, str]]],
+    include_meta: bool = True,
+) -> int:
+    """Insert many images to the database in a single transaction. This
+    is the bulk counterpart of add_image: instead of inserting each image
+    along with its patient, study, and series, each table receives one
+    multi-row insert for all the images. Images that already exist in the
+    database (based on the SOPInstanceUID) are skipped.
+
+    Parameters
+    ----------
+    session : Session
+        The database session to use for inserting the DICOM images into the
+        database.
+    dcms : Iterable[Union[str, Dataset, Tuple[Union[str, Dataset], str, str]]]
+        The DICOM images to add to the database. Each item is either a DICOM
+        image or a (DICOM image, institution, filepath) tuple.
+    include_meta : bool
+        If True, store the DICOM images' tags (without the pixel data)
+        in the images' meta column. The default is True.
+
+    Returns
+    -------
+    int
+        The number of images that were inserted.
+    """
+    patients, studies, series_rows, images = [], [], [], []
+    for item in dcms:
+        if isinstance(item, tuple):
+            dcm, institution, filepath = item
+        else:
+            dcm, institution, filepath = item, None, None
+        models = dcm2dbmodels(
+            dcm, institution=institution, filepath=filepath, include_meta=include_meta
+        )
+        for rows, instance in zip((patients, studies, series_rows, images), models):
+            rows.append(_column_values(instance))
+    if not images:
+        return 0
+
+    for study, pat_dbid in zip(
+        studies, _insert_many_or_get_ids(session, Patient, "patient_id", patients)
+    ):
+        study["patient_id"] = pat_dbid
+    for series, study_dbid in zip(
+        series_rows, _insert_many_or_get_ids(session, Study, "study_uid", studies)
+    ):
+        series["study_id"] = study_dbid
+    for image, series_dbid in zip(
+        images, _insert_many_or_get_ids(session, Series, "series_uid", series_rows)
+    ):
+        image["series_id"] = series_dbid
+
+    existing = _ids_by_uid(
+        session, Image, "image_uid", {img["image_uid"] for img in images}
+    )
+    seen_uids = set(existing)
+    new_images = []
+    for image in images:
+        if image["image_uid"] not in seen_uids:
+            new_images.append(image)
+            if image["image_uid"] is not None:
+                seen_uids.add(image["image_uid"])
+    _insert_missing(session, Image, "image_uid", new_images)
+    session.commit()
+    return len(new_images)
 
 
 def update_retrieved_study(session: Session, study_uid: str) -> Optional[StudyFind]:
@@ -190,6 +433,61 @@ def get_study_uids_to_move(session: Session) -> List[str]:
     return [study_find.study_uid for study_find in get_studies_to_move(session)]
 
 
+def iter_study_uids_to_move(session: Session, batch_size: int = 10000) -> Iterator[str]:
+    """Iterate over the StudyInstanceUID values to retrieve without
+    loading them all in memory at once.
+
+    Study UIDs are selected in batches of at most batch_size values,
+    ordered by study UID. Each batch is fully fetched before being
+    yielded so that no cursor is left open while the caller updates
+    the database (eg: by marking studies as retrieved).
+
+    Parameters
+    ----------
+    session : Session
+        The database session to use.
+    batch_size : int
+        The maximum number of study UIDs to select at a time. The
+        default is 10000.
+
+    Yields
+    ------
+    str
+        A StudyInstanceUID resource that should be moved.
+    """
+    last_uid = None
+    while True:
+        query = select(StudyFind.study_uid).where(StudyFind.retrieved_on == None)
+        if last_uid is not None:
+            query = query.where(StudyFind.study_uid > last_uid)
+        query = query.order_by(StudyFind.study_uid).limit(batch_size)
+
+        study_uids = session.execute(query).scalars().all()
+        if not study_uids:
+            return
+
+        yield from study_uids
+        last_uid = study_uids[-1]
+
+
+def _bulk_engine_kwargs(conn_uri: str, batch_size: int) -> dict:
+    """Return the create_engine keyword arguments that let the database
+    driver send the rows of executemany calls batch_size at a time
+    instead of one statement per row.
+    """
+    url = make_url(conn_uri)
+    driver = url.get_driver_name()
+    if driver == "psycopg2":
+        return {
+            "executemany_mode": "values_plus_batch",
+            "executemany_values_page_size": batch_size,
+            "executemany_batch_page_size": batch_size,
+        }
+    if driver == "pyodbc":
+        return {"fast_executemany": True}
+    return {}
+
+
 class DBWrapper:
     """A wrapper class for the database connections. The purpose of this is
     to be able to open database connections lazily inside a thread that may
@@ -206,12 +504,30 @@ class DBWrapper:
     debug : bool
         If True, echo SQL statements to the standard output. The default
         is False.
+    batch_size : Optional[int]
+        If set, tune the engine for bulk inserts: executemany calls send
+        batch_size rows at a time with drivers that support it, and SQLite
+        connections are tuned for bulk inserts (see
+        pacsanini.db.engines.get_or_create_bulk). The default is None.
+    wal : bool
+        If True and batch_size is set, switch SQLite databases to
+        write-ahead logging. This setting persists in the database file.
+        The default is False.
     """
 
-    def __init__(self, conn_uri: str, create_tables: bool = False, debug: bool = False):
+    def __init__(
+        self,
+        conn_uri: str,
+        create_tables: bool = False,
+        debug: bool = False,
+        batch_size: Optional[int] = None,
+        wal: bool = False,
+    ):
         self.conn_uri = conn_uri
         self.create_tables = create_tables
         self.debug = debug
+        self.batch_size = batch_size
+        self.wal = wal
         self.engine: Engine = None
         self.session: Session = None
 
@@ -221,10 +537,23 @@ class DBWrapper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    @lru_cache(maxsize=1)
     def conn(self) -> Session:
-        """Obtain a session instance"""
-        self.engine = create_engine(self.conn_uri)
+        """Obtain a session instance. The session is created on the first
+        call and the same session is returned afterwards.
+        """
+        if self.session is not None:
+            return self.session
+
+        # Share the engine used by pacsanini.db.get_db_session, or the one
+        # used for bulk inserts.
+        engine_kwargs = engines.default_kwargs(self.conn_uri)
+        if self.batch_size is None:
+            self.engine = engines.get_or_create(self.conn_uri, **engine_kwargs)
+        else:
+            engine_kwargs.update(_bulk_engine_kwargs(self.conn_uri, self.batch_size))
+            self.engine = engines.get_or_create_bulk(
+                self.conn_uri, wal=self.wal, **engine_kwargs
+            )
         if self.create_tables:
             config = PacsaniniConfig(
                 storage=StorageConfig(resources=self.conn_uri, directory="./")
@@ -239,8 +568,8 @@ class DBWrapper:
         return self.session
 
     def close(self):
-        """Close the instance's current session and engine if they are still open."""
+        """Close the instance's current session if it is still open. The
+        engine is shared through pacsanini.db.engines and stays open.
+        """
         if self.session is not None:
             self.session.close()
-        if self.engine is not None:
-            self.engine.dispose()
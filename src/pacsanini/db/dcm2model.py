@@ -5,13 +5,141 @@
 """The dcm2model module provides methods that can be used to convert pydicom.Dataset
 instances to sqlalchemy instances.
 """
-from typing import Tuple, Union
+from typing import Any, Dict, Tuple, Union
 
 from pydicom import Dataset, dcmread
+from pydicom.filereader import read_partial
+from pydicom.tag import BaseTag, Tag
 
 from pacsanini.convert import agestr2years, dcm2dict, str2datetime
 from pacsanini.db.models import Image, Patient, Series, Study, StudyFind
-from pacsanini.parse import DicomTagGroup
+from pacsanini.parse import DicomTagGroup, FrozenTags, parse_frozen_tags
+
+
+# The DICOM tags read to fill the database columns (the image's meta
+# column aside).
+_DB_TAGS = (
+    "PatientID",
+    "PatientName",
+    "PatientBirthDate",
+    "StudyInstanceUID",
+    "StudyDate",
+    "PatientAge",
+    "AccessionNumber",
+    "SeriesInstanceUID",
+    "Modality",
+    "SOPClassUID",
+    "SOPInstanceUID",
+    "AcquisitionTime",
+    "Manufacturer",
+    "ManufacturerModelName",
+)
+_DB_TAG_NUMBERS = [Tag(keyword) for keyword in _DB_TAGS]
+# DICOM elements are stored in ascending tag order: once an element
+# that comes after this tag is reached, all the database tags are read.
+_LAST_DB_TAG = max(_DB_TAG_NUMBERS)
+
+
+# The tags parsed by each of the dcm2* functions. They are built once
+# instead of for every converted DICOM file.
+_PATIENT_TAGS = DicomTagGroup(
+    tags=[
+        {"tag_name": "PatientID", "tag_alias": "patient_id"},
+        {"tag_name": "PatientName", "tag_alias": "patient_name", "callback": str},
+        {
+            "tag_name": "PatientBirthDate",
+            "tag_alias": "patient_birth_date",
+            "callback": str2datetime,
+        },
+    ]
+)
+
+_STUDY_TAGS = DicomTagGroup(
+    tags=[
+        {"tag_name": "StudyInstanceUID", "tag_alias": "study_uid"},
+        {
+            "tag_name": "StudyDate",
+            "tag_alias": "study_date",
+            "callback": str2datetime,
+        },
+        {
+            "tag_name": "PatientAge",
+            "tag_alias": "patient_age",
+            "callback": agestr2years,
+            "default": -1,
+        },
+        {"tag_name": "AccessionNumber", "tag_alias": "accession_number"},
+    ]
+)
+
+_STUDY_FIND_TAGS = DicomTagGroup(
+    tags=[
+        {"tag_name": "PatientName", "tag_alias": "patient_name", "callback": str},
+        {"tag_name": "PatientID", "tag_alias": "patient_id"},
+        {"tag_name": "StudyInstanceUID", "tag_alias": "study_uid"},
+        {
+            "tag_name": "StudyDate",
+            "tag_alias": "study_date",
+            "callback": str2datetime,
+        },
+        {"tag_name": "AccessionNumber", "tag_alias": "accession_number"},
+    ]
+)
+
+_SERIES_TAGS = DicomTagGroup(
+    tags=[
+        {"tag_name": "SeriesInstanceUID", "tag_alias": "series_uid"},
+        {"tag_name": "Modality", "tag_alias": "modality"},
+    ]
+)
+
+_IMAGE_TAGS = DicomTagGroup(
+    tags=[
+        {"tag_name": "PatientID", "tag_alias": "patient_id"},
+        {"tag_name": "StudyInstanceUID", "tag_alias": "study_uid"},
+        {
+            "tag_name": "StudyDate",
+            "tag_alias": "study_date",
+            "callback": str2datetime,
+        },
+        {"tag_name": "SeriesInstanceUID", "tag_alias": "series_uid"},
+        {"tag_name": "Modality", "tag_alias": "modality"},
+        {"tag_name": "SOPClassUID", "tag_alias": "sop_class_uid"},
+        {"tag_name": "SOPInstanceUID", "tag_alias": "image_uid"},
+        {"tag_name": "AcquisitionTime", "tag_alias": "acquisition_time"},
+        {"tag_name": "Manufacturer", "tag_alias": "manufacturer"},
+        {
+            "tag_name": "ManufacturerModelName",
+            "tag_alias": "manufacturer_model_name",
+        },
+    ]
+)
+
+
+def _merge_tags(*groups: DicomTagGroup) -> FrozenTags:
+    merged = {}
+    for group in groups:
+        for tag in group.freeze():
+            merged.setdefault(tag[0], tag)
+    return tuple(merged.values())
+
+
+def _tag_aliases(group: DicomTagGroup) -> Tuple[str, ...]:
+    return tuple(str(tag.tag_alias) for tag in group.tags)
+
+
+# The tags used by dcm2dbmodels, each parsed once per DICOM file even if
+# it fills several models, and the aliases of each model's tags.
+_DB_MODEL_TAGS = _merge_tags(_PATIENT_TAGS, _STUDY_TAGS, _SERIES_TAGS, _IMAGE_TAGS)
+_PATIENT_KEYS = _tag_aliases(_PATIENT_TAGS)
+_STUDY_KEYS = _tag_aliases(_STUDY_TAGS)
+_SERIES_KEYS = _tag_aliases(_SERIES_TAGS)
+_IMAGE_KEYS = _tag_aliases(_IMAGE_TAGS)
+
+
+def _extract_all(dcm: Dataset) -> Dict[str, Any]:
+    """Return the values of all the tags used by dcm2dbmodels."""
+    return parse_frozen_tags(dcm, _DB_MODEL_TAGS)
 
 
 def dcm2patient(dcm: Dataset, institution: str = None) -> Patient:
@@ -31,18 +159,7 @@ def dcm2patient(dcm: Dataset, institution: str = None) -> Patient:
     Patient
         The Patient model.
     """
-    tag_grp = DicomTagGroup(
-        tags=[
-            {"tag_name": "PatientID", "tag_alias": "patient_id"},
-            {"tag_name": "PatientName", "tag_alias": "patient_name", "callback": str},
-            {
-                "tag_name": "PatientBirthDate",
-                "tag_alias": "patient_birth_date",
-                "callback": str2datetime,
-            },
-        ]
-    )
-    data = tag_grp.parse_dicom(dcm)
+    data = _PATIENT_TAGS.parse_dicom(dcm)
     data["institution"] = institution
     return Patient(**data)
 
@@ -61,24 +178,7 @@ def dcm2study(dcm: Dataset) -> Study:
     Study
         The Study model.
     """
-    tag_grp = DicomTagGroup(
-        tags=[
-            {"tag_name": "StudyInstanceUID", "tag_alias": "study_uid"},
-            {
-                "tag_name": "StudyDate",
-                "tag_alias": "study_date",
-                "callback": str2datetime,
-            },
-            {
-                "tag_name": "PatientAge",
-                "tag_alias": "patient_age",
-                "callback": agestr2years,
-                "default": -1,
-            },
-            {"tag_name": "AccessionNumber", "tag_alias": "accession_number"},
-        ]
-    )
-    data = tag_grp.parse_dicom(dcm)
+    data = _STUDY_TAGS.parse_dicom(dcm)
     return Study(**data)
 
 
@@ -96,20 +196,7 @@ def dcm2study_finding(dcm: Dataset) -> StudyFind:
     StudyFind
         The StudyFind model.
     """
-    tag_grp = DicomTagGroup(
-        tags=[
-            {"tag_name": "PatientName", "tag_alias": "patient_name", "callback": str},
-            {"tag_name": "PatientID", "tag_alias": "patient_id"},
-            {"tag_name": "StudyInstanceUID", "tag_alias": "study_uid"},
-            {
-                "tag_name": "StudyDate",
-                "tag_alias": "study_date",
-                "callback": str2datetime,
-            },
-            {"tag_name": "AccessionNumber", "tag_alias": "accession_number"},
-        ]
-    )
-    data = tag_grp.parse_dicom(dcm)
+    data = _STUDY_FIND_TAGS.parse_dicom(dcm)
     return StudyFind(**data)
 
 
@@ -127,17 +214,16 @@ def dcm2series(dcm: Dataset) -> Series:
     Series
         The Series model.
     """
-    tag_grp = DicomTagGroup(
-        tags=[
-            {"tag_name": "SeriesInstanceUID", "tag_alias": "series_uid"},
-            {"tag_name": "Modality", "tag_alias": "modality"},
-        ]
-    )
-    data = tag_grp.parse_dicom(dcm)
+    data = _SERIES_TAGS.parse_dicom(dcm)
     return Series(**data)
 
 
-def dcm2image(dcm: Dataset, institution: str = None, filepath: str = None) -> Image:
+def dcm2image(
+    dcm: Dataset,
+    institution: str = None,
+    filepath: str = None,
+    include_meta: bool = True,
+) -> Image:
     """Convert a DICOM file to a Image instance that can be inserted
     in the database.
 
@@ -151,42 +237,42 @@ def dcm2image(dcm: Dataset, institution: str = None, filepath: str = None) -> Im
     filepath : str
         If set, add the DICOM's filepath to the database. The default
         is None.
+    include_meta : bool
+        If True, store the DICOM's tags (without the pixel data) in the
+        image's meta column. The default is True.
 
     Returns
     -------
     Image
         The Image model.
     """
-    tag_grp = DicomTagGroup(
-        tags=[
-            {"tag_name": "PatientID", "tag_alias": "patient_id"},
-            {"tag_name": "StudyInstanceUID", "tag_alias": "study_uid"},
-            {
-                "tag_name": "StudyDate",
-                "tag_alias": "study_date",
-                "callback": str2datetime,
-            },
-            {"tag_name": "SeriesInstanceUID", "tag_alias": "series_uid"},
-            {"tag_name": "Modality", "tag_alias": "modality"},
-            {"tag_name": "SOPClassUID", "tag_alias": "sop_class_uid"},
-            {"tag_name": "SOPInstanceUID", "tag_alias": "image_uid"},
-            {"tag_name": "AcquisitionTime", "tag_alias": "acquisition_time"},
-            {"tag_name": "Manufacturer", "tag_alias": "manufacturer"},
-            {
-                "tag_name": "ManufacturerModelName",
-                "tag_alias": "manufacturer_model_name",
-            },
-        ]
-    )
-    data = tag_grp.parse_dicom(dcm)
-    data["meta"] = dcm2dict(dcm, include_pixels=False)
+    data = _IMAGE_TAGS.parse_dicom(dcm)
+    data["meta"] = dcm2dict(dcm, include_pixels=False) if include_meta else None
     data["institution"] = institution
     data["filepath"] = filepath
     return Image(**data)
 
 
+def _after_db_tags(tag: BaseTag, vr: str, length: int) -> bool:
+    # pylint: disable=unused-argument
+    return tag > _LAST_DB_TAG
+
+
+def _read_for_db(path: str) -> Dataset:
+    """Read the tags that fill the database columns of a DICOM file. The
+    file is not read past the last of these tags.
+    """
+    with open(path, "rb") as in_:
+        return read_partial(
+            in_, stop_when=_after_db_tags, specific_tags=list(_DB_TAG_NUMBERS)
+        )
+
+
 def dcm2dbmodels(
-    dcm: Union[str, Dataset], institution: str = None, filepath: str = None
+    dcm: Union[str, Dataset],
+    institution: str = None,
+    filepath: str = None,
+    include_meta: bool = True,
 ) -> Tuple[Patient, Study, Series, Image]:
     """Convert a DICOM file into the different database models that will be used
     to insert the DICOM data into the database.
@@ -202,6 +288,11 @@ def dcm2dbmodels(
         If set, add the DICOM's filepath to the database. The default
         is None. If the input dcm parameter value is a string, filepath
         will be set to this.
+    include_meta : bool
+        If True, store the DICOM's tags (without the pixel data) in the
+        image's meta column. Otherwise, the meta column is left empty and
+        DICOM files are only read up to the database columns' tags. The
+        default is True.
 
     Returns
     -------
@@ -210,10 +301,19 @@ def dcm2dbmodels(
     """
     if isinstance(dcm, str):
         filepath = dcm
-        dcm = dcmread(dcm, stop_before_pixels=True)
+        if include_meta:
+            dcm = dcmread(dcm, stop_before_pixels=True)
+        else:
+            dcm = _read_for_db(dcm)
 
-    pat = dcm2patient(dcm, institution=institution)
-    study = dcm2study(dcm)
-    series = dcm2series(dcm)
-    image = dcm2image(dcm, institution=institution, filepath=filepath)
+    data = _extract_all(dcm)
+    pat = Patient(**{key: data[key] for key in _PATIENT_KEYS}, institution=institution)
+    study = Study(**{key: data[key] for key in _STUDY_KEYS})
+    series = Series(**{key: data[key] for key in _SERIES_KEYS})
+    image = Image(
+        **{key: data[key] for key in _IMAGE_KEYS},
+        meta=dcm2dict(dcm, include_pixels=False) if include_meta else None,
+        institution=institution,
+        filepath=filepath,
+    )
     return pat, study, series, image
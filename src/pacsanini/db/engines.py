@@ -0,0 +1,154 @@
+# Copyright (C) 2019-2020, Therapixel SA.
+# All rights reserved.
+# This file is subject to the terms and conditions described in the
+# LICENSE file distributed in this package.
+"""The engines module keeps a registry of the database engines used by
+pacsanini so that the different steps of a pipeline (eg: finding and
+then moving studies) share an engine and its connection pool instead
+of each creating their own.
+"""
+import atexit
+import threading
+
+from typing import Any, Dict, Hashable, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+
+_ENGINES: Dict[Tuple[str, Hashable, Tuple[str, ...]], Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+def default_kwargs(db_uri: str) -> Dict[str, Any]:
+    """Return the create_engine keyword arguments that pacsanini uses for
+    a database so that its different users end up sharing one engine.
+
+    SQLite connections may be used by other threads than the one that
+    opened them. Server databases get a larger connection pool whose
+    connections are checked before being handed out.
+
+    Parameters
+    ----------
+    db_uri : str
+        The database's URI.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The create_engine keyword arguments.
+    """
+    if db_uri.lower().startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}
+    return {"pool_size": 10, "max_overflow": 20, "pool_pre_ping": True}
+
+
+# The PRAGMAs set on the connections of SQLite bulk engines: temporary
+# tables, the page cache (64 MiB) and memory-mapped reads (256 MiB) trade
+# memory for disk accesses, and the journal is synced to disk less often.
+# These settings only last as long as the connection.
+_SQLITE_BULK_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+# Unlike the other PRAGMAs, the journal mode is stored in the database
+# file and applies to all of its later users.
+_SQLITE_WAL_PRAGMA = "PRAGMA journal_mode=WAL"
+
+
+def _register(
+    key: Tuple[str, Hashable, Tuple[str, ...]], db_uri: str, kwargs: Dict[str, Any]
+) -> Engine:
+    pragmas = key[2]
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = create_engine(db_uri, **kwargs)
+            if pragmas:
+
+                @event.listens_for(engine, "connect")
+                def set_pragmas(dbapi_conn, _):
+                    cursor = dbapi_conn.cursor()
+                    for pragma in pragmas:
+                        cursor.execute(pragma)
+                    cursor.close()
+
+            _ENGINES[key] = engine
+    return engine
+
+
+def get_or_create(db_uri: str, **kwargs) -> Engine:
+    """Return the engine registered for the database URI and the
+    create_engine keyword arguments, creating it on the first call.
+
+    Parameters
+    ----------
+    db_uri : str
+        The database's URI.
+    **kwargs
+        Keyword arguments passed on to sqlalchemy.create_engine. Engines
+        created with different arguments are registered separately.
+
+    Returns
+    -------
+    Engine
+        The database engine.
+    """
+    return _register((db_uri, _freeze(kwargs), ()), db_uri, kwargs)
+
+
+def get_or_create_bulk(db_uri: str, wal: bool = False, **kwargs) -> Engine:
+    """Return the engine registered for bulk inserts in the database, creating
+    it on the first call.
+
+    Bulk engines are registered separately from the engines returned by
+    get_or_create. For SQLite databases, every connection they open is
+    tuned for bulk inserts without changing the connections of other
+    engines. Other databases get the same engine as get_or_create.
+
+    Parameters
+    ----------
+    db_uri : str
+        The database's URI.
+    wal : bool
+        If True, also switch SQLite databases to write-ahead logging so
+        that readers are not blocked while data is inserted. The journal
+        mode is stored in the database file: it remains in effect for all
+        the database's users afterwards. The default is False.
+    **kwargs
+        Keyword arguments passed on to sqlalchemy.create_engine.
+
+    Returns
+    -------
+    Engine
+        The database engine.
+    """
+    if not db_uri.lower().startswith("sqlite"):
+        return get_or_create(db_uri, **kwargs)
+
+    pragmas = _SQLITE_BULK_PRAGMAS
+    if wal:
+        pragmas = (_SQLITE_WAL_PRAGMA,) + pragmas
+    return _register((db_uri, _freeze(kwargs), pragmas), db_uri, kwargs)
+
+
+def dispose_all():
+    """Dispose of every registered engine and clear the registry."""
+    with _ENGINES_LOCK:
+        engines = list(_ENGINES.values())
+        _ENGINES.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+atexit.register(dispose_all)
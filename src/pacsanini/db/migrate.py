@@ -7,14 +7,21 @@ to check alembic versions in given databases and methods to create/drop views.
 The migration methods were taken from:
 https://alembic.sqlalchemy.org/en/latest/cookbook.html#create-operations-for-the-target-objects
 """
+import weakref
+
 from pathlib import Path
+from typing import Dict, FrozenSet, MutableMapping, Optional
 
-from alembic import command, op
+from alembic import op
 from alembic.config import Config
+from alembic.migration import MigrationContext
 from alembic.operations import MigrateOperation, Operations
-from sqlalchemy import create_engine, engine_from_config, inspect
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
 
 from pacsanini.config import PacsaniniConfig
+from pacsanini.db import engines
 
 
 def get_alembic_config(config: PacsaniniConfig) -> Config:
@@ -48,49 +55,60 @@ def get_alembic_config(config: PacsaniniConfig) -> Config:
 
 def get_latest_version(config: Config) -> str:
     """Get the latest migration version for the database from the project's
-    configuration settings.
+    migration scripts.
     """
-    revision = ""
+    return ScriptDirectory.from_config(config).get_current_head()
 
-    def print_stdout(text: str, *args):
-        nonlocal revision
-        revision = text.split(" ")[0]
 
-    config.print_stdout = print_stdout  # type: ignore
-    command.current(config)
-    return revision
+def _get_engine(config: Config) -> Engine:
+    """Return the engine registered in pacsanini.db.engines for the
+    database of the alembic configuration. Unlike an engine created for
+    each check, it keeps its connections open between calls.
+    """
+    url = config.get_main_option("sqlalchemy.url")
+    return engines.get_or_create(url, **engines.default_kwargs(url))
 
 
 def get_current_version(config: Config) -> str:
     """Get the database's current version from the database. If no revision
     was found, return an empty string.
     """
-    url = config.get_main_option("sqlalchemy.url")
-    engine = create_engine(url)
-    version = ""
-    try:
-        if not inspect(engine).has_table("alembic_version"):
-            return ""
-
-        with engine.connect() as conn:
-            results = conn.execute("SELECT version_num FROM alembic_version LIMIT 1;")
-            for res in results:
-                version = res[0]
-                break
-    finally:
-        engine.dispose()
-    return version
+    engine = _get_engine(config)
+    if not inspect(engine).has_table("alembic_version"):
+        return ""
+
+    with engine.connect() as conn:
+        query = text("SELECT version_num FROM alembic_version LIMIT 1")
+        version = conn.execute(query).scalar()
+    return version or ""
+
+
+# The names of the tables and views of each schema, read once per
+# migration context, ie: once per alembic command.
+_TABLE_NAMES: MutableMapping[
+    MigrationContext, Dict[Optional[str], FrozenSet[str]]
+] = weakref.WeakKeyDictionary()
+
+
+def _table_names(context: MigrationContext, schema: Optional[str]) -> FrozenSet[str]:
+    names = _TABLE_NAMES.setdefault(context, {})
+    if schema not in names:
+        inspector = inspect(_get_engine(context.config))
+        tables = inspector.get_table_names(schema=schema)
+        views = inspector.get_view_names(schema=schema)
+        names[schema] = frozenset(tables) | frozenset(views)
+    return names[schema]
 
 
 def table_exists(table: str, schema: str = None) -> bool:
     """Check whether a given table exists in the database and return True if
     it does -False otherwise.
+
+    The database's tables and views are listed on the first call made by
+    a migration command and the following calls reuse that list: tables
+    created by the running migration are not seen as existing.
     """
-    config: Config = op.get_context().config
-    engine = engine_from_config(
-        config.get_section(config.config_ini_section), prefix="sqlalchemy."
-    )
-    return inspect(engine).has_table(table, schema=schema)
+    return table in _table_names(op.get_context(), schema)
 
 
 class ReplaceableObject:
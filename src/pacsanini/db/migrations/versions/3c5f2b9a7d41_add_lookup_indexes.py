@@ -0,0 +1,53 @@
+# Copyright (C) 2019-2020, Therapixel SA.
+# All rights reserved.
+# This file is subject to the terms and conditions described in the
+# LICENSE file distributed in this package.
+"""Add lookup indexes
+
+Revision ID: 3c5f2b9a7d41
+Revises: eef30b8456eb
+Create Date: 2021-12-06 09:42:18.514207
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+# pylint: disable=invalid-name
+revision = "3c5f2b9a7d41"
+down_revision = "eef30b8456eb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_studies_find_study_uid_to_move",
+        "studies_find",
+        ["study_uid"],
+        unique=False,
+        postgresql_where=sa.text("retrieved_on IS NULL"),
+        sqlite_where=sa.text("retrieved_on IS NULL"),
+    )
+    op.create_index(
+        "ix_studies_patient_id_study_uid",
+        "studies",
+        ["patient_id", "study_uid"],
+        unique=False,
+    )
+    op.create_index(op.f("ix_series_study_id"), "series", ["study_id"], unique=False)
+    op.create_index(
+        "ix_images_series_id_image_uid",
+        "images",
+        ["series_id", "image_uid"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_images_series_id_image_uid", table_name="images")
+    op.drop_index(op.f("ix_series_study_id"), table_name="series")
+    op.drop_index("ix_studies_patient_id_study_uid", table_name="studies")
+    op.drop_index("ix_studies_find_study_uid_to_move", table_name="studies_find")
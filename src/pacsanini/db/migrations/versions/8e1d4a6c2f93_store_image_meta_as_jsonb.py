@@ -0,0 +1,50 @@
+# Copyright (C) 2019-2020, Therapixel SA.
+# All rights reserved.
+# This file is subject to the terms and conditions described in the
+# LICENSE file distributed in this package.
+"""Store image meta as JSONB
+
+Revision ID: 8e1d4a6c2f93
+Revises: 3c5f2b9a7d41
+Create Date: 2021-12-08 14:03:51.862094
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+# pylint: disable=invalid-name
+revision = "8e1d4a6c2f93"
+down_revision = "3c5f2b9a7d41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Only PostgreSQL has a binary JSON type: other databases keep JSON.
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "images",
+        "meta",
+        type_=postgresql.JSONB(none_as_null=True),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="meta::jsonb",
+    )
+
+
+def downgrade():
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "images",
+        "meta",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(none_as_null=True),
+        existing_nullable=True,
+        postgresql_using="meta::json",
+    )
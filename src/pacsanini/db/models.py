@@ -8,7 +8,17 @@ in a SQL database.
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import declarative_base, relationship
 
 
@@ -33,6 +43,16 @@ class StudyFind(Base):
 
     study: "Study" = relationship("Study", back_populates="study_find")
 
+    __table_args__ = (
+        # Only covers the studies that remain to be moved.
+        Index(
+            "ix_studies_find_study_uid_to_move",
+            "study_uid",
+            postgresql_where=retrieved_on.is_(None),
+            sqlite_where=retrieved_on.is_(None),
+        ),
+    )
+
     def __repr__(self):
         study_date = self.study_date.strftime("%Y%m%d")
         return f"<StudyFind: pid={self.patient_id}, pn={self.patient_name}, sd={study_date}>"
@@ -83,6 +103,10 @@ class Study(Base):
 
     study_find: "StudyFind" = relationship("StudyFind", back_populates="study")
 
+    __table_args__ = (
+        Index("ix_studies_patient_id_study_uid", "patient_id", "study_uid"),
+    )
+
     def __repr__(self) -> str:
         return f"<Study: {self.study_uid}>"
 
@@ -95,7 +119,7 @@ class Series(Base):
     __tablename__ = "series"
 
     id = Column(Integer, primary_key=True)
-    study_id = Column(Integer, ForeignKey("studies.id"))
+    study_id = Column(Integer, ForeignKey("studies.id"), index=True)
     series_uid = Column(String, unique=True)
     modality = Column(String)
 
@@ -124,8 +148,15 @@ class Image(Base):
     acquisition_time = Column(Float, default=-1)
     manufacturer = Column(String)
     manufacturer_model_name = Column(String)
-    meta = Column(JSON, nullable=True)
+    meta = Column(
+        JSON(none_as_null=True).with_variant(
+            postgresql.JSONB(none_as_null=True), "postgresql"
+        ),
+        nullable=True,
+    )
     filepath = Column(String, nullable=True)
 
+    __table_args__ = (Index("ix_images_series_id_image_uid", "series_id", "image_uid"),)
+
     def __repr__(self):
         return f"<Image: {self.image_uid}>"
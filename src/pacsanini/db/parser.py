@@ -6,19 +6,73 @@
 and storing results into a given database.
 """
 from datetime import datetime
+from typing import List, Tuple
 
-from pacsanini.db.crud import DBWrapper, add_image
+from loguru import logger
+from pydicom import Dataset
+
+from pacsanini.db.crud import DBWrapper, add_image, add_images
+from pacsanini.db.dcm2model import _read_for_db
 from pacsanini.io.base_parser import parse_dir
 
 
-def _inner_sql(result: dict, db_wrapper: DBWrapper, institution_name: str):
-    dcm = result.pop("dicom")
-    add_image(
-        db_wrapper.conn(),
-        dcm,
-        institution=institution_name,
-        filepath=result["dicom_path"],
-    )
+class _ImageBatch:
+    """Collect the DICOM files parsed by parse_dir and insert them in the
+    database batch_size at a time with add_images. parse_dir passes all
+    the results to a single consumer thread, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        db_wrapper: DBWrapper,
+        institution_name: str,
+        batch_size: int,
+        store_meta: bool,
+    ):
+        self.db_wrapper = db_wrapper
+        self.institution_name = institution_name
+        self.batch_size = batch_size
+        self.store_meta = store_meta
+        self.items: List[Tuple[Dataset, str, str]] = []
+
+    def __call__(self, result: dict):
+        dcm = result.pop("dicom")
+        self.items.append((dcm, self.institution_name, result["dicom_path"]))
+        if len(self.items) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Insert the collected DICOM files. If the batch cannot be
+        inserted, its files are inserted one by one so that a single
+        invalid file does not prevent the others from being stored.
+        """
+        if not self.items:
+            return
+
+        items, self.items = self.items, []
+        session = self.db_wrapper.conn()
+        try:
+            add_images(session, items, include_meta=self.store_meta)
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            session.rollback()
+            logger.warning(
+                f"Failed to insert a batch of images due to {err}."
+                " Inserting them one by one."
+            )
+
+        for dcm, institution, filepath in items:
+            try:
+                add_image(
+                    session,
+                    dcm,
+                    institution=institution,
+                    filepath=filepath,
+                    include_meta=self.store_meta,
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                session.rollback()
+                logger.warning(f"Failed to insert {filepath} due to {err}")
 
 
 def parse_dir2sql(
@@ -27,6 +81,9 @@ def parse_dir2sql(
     institution_name: str = None,
     nb_threads: int = 1,
     create_tables: bool = False,
+    batch_size: int = 1000,
+    store_meta: bool = True,
+    wal: bool = False,
 ):
     """Parse a DICOM directory and persist the found results in the database
     specified by the conn_uri parameter.
@@ -35,7 +92,8 @@ def parse_dir2sql(
     -----
     Unlike other parse_dir wrapper methods, this method does not use the DICOMTagParser
     instance. Parsed DICOM files will have basic DICOM tag metadata stored in traditional
-    columns as well as the entire DICOM file (pixel data excluded) stored in JSON format.
+    columns as well as, if store_meta is True, the entire DICOM file (pixel data excluded)
+    stored in JSON format.
 
     Parameters
     ----------
@@ -52,16 +110,39 @@ def parse_dir2sql(
     create_tables : bool
         If True, create the database tables before inserting the first
         parser result. The default is False.
+    batch_size : int
+        The number of parsed DICOM files inserted in the database at a
+        time, which is also the number of rows the database driver sends
+        per statement for bulk inserts, where supported. SQLite connections
+        are tuned for bulk inserts. The default is 1000.
+    store_meta : bool
+        If True, store the DICOM files' tags (pixel data excluded) in JSON
+        format in the images' meta column. Converting every tag is the most
+        expensive part of parsing a file: set this to False if only the
+        basic DICOM tag metadata is needed: DICOM files are then only read
+        up to the tags stored in the database columns. The default is True.
+    wal : bool
+        If True, switch SQLite databases to write-ahead logging before
+        inserting results. This setting persists in the database file.
+        The default is False.
     """
     if institution_name is None:
         institution_name = f"unknown_{datetime.now().strftime('%Y%m%d')}"
 
-    with DBWrapper(conn_uri, create_tables=create_tables, debug=True) as wrapper:
+    with DBWrapper(
+        conn_uri,
+        create_tables=create_tables,
+        debug=True,
+        batch_size=batch_size,
+        wal=wal,
+    ) as wrapper:
+        batch = _ImageBatch(wrapper, institution_name, batch_size, store_meta)
         parse_dir(
             src,
             None,
-            _inner_sql,
+            batch,
             nb_threads=nb_threads,
-            callback_args=(wrapper, institution_name),
             include_path=True,
+            read_func=None if store_meta else _read_for_db,
         )
+        batch.flush()
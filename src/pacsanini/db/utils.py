@@ -12,16 +12,31 @@ from typing import Generator, List
 
 from alembic import command
 from loguru import logger
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import select
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy_utils import create_database, database_exists
 
 from pacsanini.config import PacsaniniConfig
+from pacsanini.db import engines
 from pacsanini.db.migrate import get_alembic_config, get_latest_version
 from pacsanini.db.models import Image, Patient, Series, Study, StudyFind
 
 
+# The page size of new SQLite databases. Larger pages than SQLite's
+# 4096 bytes default suit the images' JSON metadata rows.
+_SQLITE_PAGE_SIZE = 8192
+
+
+def _set_sqlite_page_size(db_uri: str):
+    """Set the page size of a new, empty, SQLite database. The page size
+    only changes once the database is rebuilt with VACUUM.
+    """
+    engine = engines.get_or_create(db_uri, **engines.default_kwargs(db_uri))
+    with engine.connect() as conn:
+        conn.exec_driver_sql(f"PRAGMA page_size={_SQLITE_PAGE_SIZE}")
+        conn.exec_driver_sql("VACUUM")
+
+
 def initialize_database(
     config: PacsaniniConfig, echo: bool = True, force_init: bool = False
 ) -> None:
@@ -43,6 +58,8 @@ def initialize_database(
     logger.info("Initializing new pacsanini database instance...")
     if not database_exists(config.storage.resources) or force_init:
         create_database(config.storage.resources)
+        if config.storage.resources.lower().startswith("sqlite"):
+            _set_sqlite_page_size(config.storage.resources)
 
         alembic_config = get_alembic_config(config)
         revision = get_latest_version(alembic_config)
@@ -72,14 +89,9 @@ def get_db_session(db_uri: str) -> Generator[Session, None, None]:
     Generator[Session, None, None]
         The context-wrapped Session instance.
     """
-    engine: Engine = None
     db_session: Session = None
     try:
-        if db_uri.lower().startswith("sqlite"):
-            connect_args = {"check_same_thread": False}
-        else:
-            connect_args = None
-        engine = create_engine(db_uri, connect_args=connect_args)
+        engine = engines.get_or_create(db_uri, **engines.default_kwargs(db_uri))
         DBSession = sessionmaker(bind=engine)
         db_session = DBSession()
         yield db_session
@@ -90,8 +102,6 @@ def get_db_session(db_uri: str) -> Generator[Session, None, None]:
     finally:
         if db_session is not None:
             db_session.close()
-        if engine is not None:
-            engine.dispose()
 
 
 TABLES = {
@@ -104,7 +114,10 @@ TABLES = {
 
 
 def dump_database(
-    session: Session, output: str = None, tables: List[str] = None
+    session: Session,
+    output: str = None,
+    tables: List[str] = None,
+    chunk_size: int = 10000,
 ) -> None:
     """Dump the pacsanini database into CSV files. Each CSV file
     corresponds to a database table.
@@ -119,6 +132,10 @@ def dump_database(
         current directory.
     tables : List[str]
         Optional. If set, specify the tables to dump in CSV format.
+    chunk_size : int
+        The number of rows to fetch from the database and write at
+        a time. Rows are streamed so that memory usage is bounded by
+        this value rather than by the table size. The default is 10000.
 
     Raises
     ------
@@ -144,15 +161,17 @@ def dump_database(
         path = os.path.join(output, f"{table_name}.csv")
 
         table = TABLES[table_name]
-        table_cols = [col.name for col in table.__mapper__.columns]  # type: ignore
+        columns = list(table.__mapper__.columns)  # type: ignore
         start_time = time()
         logger.info(f"Initiating dump of the {table_name} table...")
 
         with open(path, "w", newline="", encoding="utf-8") as out:
-            writer = csv.DictWriter(out, table_cols)
-            writer.writeheader()
-            for record in session.query(table).all():
-                writer.writerow({col: getattr(record, col) for col in table_cols})
+            writer = csv.writer(out)
+            writer.writerow([col.name for col in columns])
+
+            stmt = select(*columns).execution_options(stream_results=True)
+            for rows in session.execute(stmt).partitions(chunk_size):
+                writer.writerows(rows)
 
         end_time = time()
         logger.info(
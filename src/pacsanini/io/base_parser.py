@@ -10,29 +10,47 @@ import queue
 import threading
 
 from collections.abc import Callable
-from typing import Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Iterator, List, Optional, Union
 
 from pydicom import dcmread
 
-from pacsanini.parse import DicomTagGroup
+from pacsanini.parse import DicomTagGroup, FrozenTags, parse_frozen_tags
+
+
+def _parse_file(
+    file_path: str,
+    parser: Optional[FrozenTags],
+    include_path: bool = True,
+    read_func: Callable = None,
+) -> dict:
+    if read_func is None:
+        read_func = partial(dcmread, stop_before_pixels=True)
+
+    dcm = read_func(file_path)
+    if parser is not None:
+        result = parse_frozen_tags(dcm, parser)
+    else:
+        result = {"dicom": dcm}
+    if include_path:
+        result["dicom_path"] = file_path
+    return result
 
 
 def _thread_worker(
-    parser: DicomTagGroup,
+    parser: Optional[FrozenTags],
     worker_queue: queue.Queue,
     consumer_queue: queue.Queue,
     stop_working: threading.Event,
     include_path: bool = True,
+    read_func: Callable = None,
 ):
     while True:
         try:
             file_path = worker_queue.get(True, timeout=1)
-            if parser is not None:
-                result = parser.parse_dicom(file_path)
-            else:
-                result = {"dicom": dcmread(file_path, stop_before_pixels=True)}
-            if include_path:
-                result["dicom_path"] = file_path
+            result = _parse_file(file_path, parser, include_path, read_func)
             consumer_queue.put(result)
         except queue.Empty:
             if stop_working.is_set():
@@ -66,16 +84,77 @@ def _thread_consumer(
             pass
 
 
-def _enqueue_files(src: Union[str, os.PathLike], worker_queue: queue.Queue):
-    """Enqueue DICOM files into the worker queue."""
+def _iter_files(src: Union[str, os.PathLike]) -> Iterator[str]:
+    """Iterate over the DICOM file paths found in the source."""
     if os.path.isfile(src):
-        worker_queue.put(src)
+        yield src  # type: ignore
         return
 
     for root, _, files in os.walk(src):
         for fname in files:
-            path = os.path.join(root, fname)
-            worker_queue.put(path)
+            yield os.path.join(root, fname)
+
+
+def _enqueue_files(src: Union[str, os.PathLike], worker_queue: queue.Queue):
+    """Enqueue DICOM files into the worker queue."""
+    for path in _iter_files(src):
+        worker_queue.put(path)
+
+
+def _iter_file_chunks(
+    src: Union[str, os.PathLike], chunk_size: int
+) -> Iterator[List[str]]:
+    """Iterate over the DICOM file paths found in the source
+    in lists of at most chunk_size paths.
+    """
+    files = _iter_files(src)
+    while True:
+        chunk = list(islice(files, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _process_worker(
+    paths: List[str],
+    parser: Optional[FrozenTags],
+    include_path: bool = True,
+    read_func: Callable = None,
+) -> List[dict]:
+    results = []
+    for file_path in paths:
+        try:
+            results.append(_parse_file(file_path, parser, include_path, read_func))
+        except Exception:  # pylint: disable=broad-except
+            # Skip the files that cannot be parsed, as thread workers do.
+            pass
+    return results
+
+
+def _parse_dir_processes(
+    src: Union[str, os.PathLike],
+    parser: Optional[FrozenTags],
+    callback: Callable,
+    callback_args: tuple,
+    callback_kwargs: dict,
+    nb_procs: int,
+    include_path: bool,
+    chunk_size: int,
+    read_func: Callable,
+):
+    worker = partial(
+        _process_worker,
+        parser=parser,
+        include_path=include_path,
+        read_func=read_func,
+    )
+    with ProcessPoolExecutor(max_workers=nb_procs) as executor:
+        for results in executor.map(worker, _iter_file_chunks(src, chunk_size)):
+            for result in results:
+                try:
+                    callback(result, *callback_args, **callback_kwargs)
+                except Exception:  # pylint: disable=broad-except
+                    pass
 
 
 def parse_dir(
@@ -86,6 +165,11 @@ def parse_dir(
     callback_kwargs: dict = None,
     nb_threads: int = 1,
     include_path: bool = True,
+    nb_procs: int = 0,
+    chunk_size: int = 64,
+    stop_before_pixels: bool = True,
+    specific_tags: bool = False,
+    read_func: Callable = None,
 ):
     """Parse a DICOM directory and return the passed results into the
     provided callback function.
@@ -114,6 +198,26 @@ def parse_dir(
         The number of threads to use for the parsing of DICOM files.
     include_path : bool
         If True, add a "dicom_path" key to the results dict.
+    nb_procs : int
+        If greater than 0, parse DICOM files in a pool of nb_procs
+        processes instead of using nb_threads threads. As DICOM parsing
+        is CPU bound, this scales better with the number of workers.
+        The parser must then be picklable. The default is 0.
+    chunk_size : int
+        The number of file paths sent to a process at a time when
+        nb_procs is greater than 0. The default is 64.
+    stop_before_pixels : bool
+        If True, the default, stop reading DICOM files before their
+        pixel data.
+    specific_tags : bool
+        If True and a parser is provided, only read the DICOM tags
+        needed by the parser from the DICOM files. The default is False.
+    read_func : Callable
+        If set, the function used to read DICOM files instead of
+        pydicom.dcmread. It is called with a file's path and must return
+        a pydicom.Dataset: stop_before_pixels and specific_tags are then
+        ignored. When nb_procs is greater than 0, it must be picklable.
+        The default is None.
     """
     if not os.path.exists(src):
         raise FileNotFoundError(f"'{src}' does not exist.")
@@ -121,9 +225,38 @@ def parse_dir(
     if nb_threads < 1:
         raise ValueError("nb_threads must be greater than 0")
 
+    if nb_procs < 0:
+        raise ValueError("nb_procs must be greater than or equal to 0")
+
     if not callable(callback):
         raise ValueError("callback must be a callable.")
 
+    if read_func is None:
+        read_func = partial(
+            dcmread,
+            stop_before_pixels=stop_before_pixels,
+            specific_tags=(
+                parser.tag_keywords() if specific_tags and parser is not None else None
+            ),
+        )
+
+    # Workers parse files with the frozen tags rather than the pydantic models.
+    frozen_tags = parser.freeze() if parser is not None else None
+
+    if nb_procs > 0:
+        _parse_dir_processes(
+            src,
+            frozen_tags,
+            callback,
+            callback_args if callback_args is not None else (),
+            callback_kwargs if callback_kwargs is not None else {},
+            nb_procs,
+            include_path,
+            chunk_size,
+            read_func,
+        )
+        return
+
     try:
         stop_working = threading.Event()
         stop_consuming = threading.Event()
@@ -143,8 +276,8 @@ def parse_dir(
         for _ in range(nb_threads):
             thread = threading.Thread(
                 target=_thread_worker,
-                args=(parser, worker_queue, consumer_queue, stop_working),
-                kwargs={"include_path": include_path},
+                args=(frozen_tags, worker_queue, consumer_queue, stop_working),
+                kwargs={"include_path": include_path, "read_func": read_func},
                 daemon=True,
             )
             threads.append(thread)
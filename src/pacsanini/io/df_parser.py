@@ -23,6 +23,7 @@ def parse_dir2df(
     parser: DicomTagGroup,
     nb_threads: int = 1,
     include_path: bool = True,
+    nb_procs: int = 0,
 ) -> pd.DataFrame:
     """Parse a DICOM directory and return the parsed DICOM
     tag results as a DataFrame.
@@ -40,6 +41,9 @@ def parse_dir2df(
     include_path : bool
         If True, add a "dicom_path" key to the parsed results.
         The default is True.
+    nb_procs : int
+        If greater than 0, use nb_procs processes instead of
+        threads when parsing DICOM files. The default is 0.
 
     Returns
     -------
@@ -55,6 +59,7 @@ def parse_dir2df(
         callback_args=(results,),
         nb_threads=nb_threads,
         include_path=include_path,
+        nb_procs=nb_procs,
     )
 
     return pd.DataFrame(results)
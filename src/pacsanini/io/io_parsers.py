@@ -10,14 +10,16 @@ import json
 
 from datetime import datetime
 from os import PathLike
-from typing import TextIO, Union
+from typing import Any, TextIO, Tuple, Union
 
 from pacsanini.io.base_parser import parse_dir
 from pacsanini.parse import DicomTagGroup
 
 
-def _write_results(result: dict, reader: csv.DictWriter):
-    reader.writerow(result)
+def _write_results(result: dict, writer: Any, fieldnames: Tuple[str, ...]):
+    # Rows are written positionally to skip csv.DictWriter's per-row
+    # check for extra keys. Missing values are written as empty strings.
+    writer.writerow([result.get(field) for field in fieldnames])
 
 
 def parse_dir2csv(
@@ -27,6 +29,9 @@ def parse_dir2csv(
     nb_threads: int = 1,
     include_path: bool = True,
     mode: str = "w",
+    nb_procs: int = 0,
+    stop_before_pixels: bool = True,
+    specific_tags: bool = False,
 ):
     """Parse a DICOM directory and write results to a CSV
     file.
@@ -49,37 +54,51 @@ def parse_dir2csv(
     mode : str
         Whether to write ("w") or append ("a") to the
         destination file.
+    nb_procs : int
+        If greater than 0, use nb_procs processes instead of
+        threads when parsing DICOM files. The default is 0.
+    stop_before_pixels : bool
+        If True, the default, don't read the DICOM pixel data.
+    specific_tags : bool
+        If True, only read the DICOM tags required by the parser.
+        The default is False.
     """
-    fieldnames = [tag.tag_alias for tag in parser.tags]
+    fieldnames = tuple(str(tag.tag_alias) for tag in parser.tags)
     if include_path:
-        fieldnames.append("dicom_path")
+        fieldnames += ("dicom_path",)
 
     if isinstance(dest, (str, PathLike)):
         with open(dest, mode, newline="") as output:
-            reader = csv.DictWriter(output, fieldnames=fieldnames)
+            writer = csv.writer(output)
             if mode == "w":
-                reader.writeheader()
+                writer.writerow(fieldnames)
 
             parse_dir(
                 src,
                 parser,
                 _write_results,
-                callback_args=(reader,),
+                callback_args=(writer, fieldnames),
                 nb_threads=nb_threads,
                 include_path=include_path,
+                nb_procs=nb_procs,
+                stop_before_pixels=stop_before_pixels,
+                specific_tags=specific_tags,
             )
     else:
-        reader = csv.DictWriter(dest, fieldnames=fieldnames)
+        writer = csv.writer(dest)
         if mode == "w":
-            reader.writeheader()
+            writer.writerow(fieldnames)
 
         parse_dir(
             src,
             parser,
             _write_results,
-            callback_args=(reader,),
+            callback_args=(writer, fieldnames),
             nb_threads=nb_threads,
             include_path=include_path,
+            nb_procs=nb_procs,
+            stop_before_pixels=stop_before_pixels,
+            specific_tags=specific_tags,
         )
 
 
@@ -101,6 +120,9 @@ def parse_dir2json(
     nb_threads: int = 1,
     include_path: bool = True,
     mode: str = "w",
+    nb_procs: int = 0,
+    stop_before_pixels: bool = True,
+    specific_tags: bool = False,
 ):
     """Parse a DICOM directory and write results to a JSON
     file.
@@ -123,6 +145,14 @@ def parse_dir2json(
     mode : str
         Whether to write ("w") or append ("a") to the
         destination file.
+    nb_procs : int
+        If greater than 0, use nb_procs processes instead of
+        threads when parsing DICOM files. The default is 0.
+    stop_before_pixels : bool
+        If True, the default, don't read the DICOM pixel data.
+    specific_tags : bool
+        If True, only read the DICOM tags required by the parser.
+        The default is False.
     """
     fieldnames = [tag.tag_alias for tag in parser.tags]
     if include_path:
@@ -136,6 +166,9 @@ def parse_dir2json(
         callback_kwargs={"results_list": results},
         nb_threads=nb_threads,
         include_path=include_path,
+        nb_procs=nb_procs,
+        stop_before_pixels=stop_before_pixels,
+        specific_tags=specific_tags,
     )
 
     if isinstance(dest, (str, PathLike)):
@@ -12,6 +12,7 @@ from typing import Generator, List, Union
 
 from pydicom import Dataset
 from pynetdicom import AE
+from pynetdicom.pdu_primitives import SOPClassExtendedNegotiation
 from pynetdicom.sop_class import (  # pylint: disable=no-name-in-module
     PatientRootQueryRetrieveInformationModelFind,
     StudyRootQueryRetrieveInformationModelFind,
@@ -33,6 +34,7 @@ def find(
     start_date: datetime,
     end_date: datetime = None,
     modality: str = "",
+    relational: bool = False,
 ) -> Generator[Dataset, None, None]:
     """Find DICOM resources from the destination DICOM node using
     the specified DICOM criteria.
@@ -65,6 +67,9 @@ def find(
         start_date parameter.
     modality : str
         If set, specify the DICOM modality to get results for.
+    relational : bool
+        If True, propose relational queries to the called node through
+        the association's extended negotiation. The default is False.
 
     Yields
     ------
@@ -106,6 +111,15 @@ def find(
     ae = AE(ae_title=local_node.aetitle)
     ae.add_requested_context(query_root)
 
+    ext_neg = None
+    if relational:
+        # The first byte of the C-FIND service class application information
+        # advertises support for relational queries.
+        relational_neg = SOPClassExtendedNegotiation()
+        relational_neg.sop_class_uid = query_root
+        relational_neg.service_class_application_information = b"\x01"
+        ext_neg = [relational_neg]
+
     current_date = start_date
     date_increment = timedelta(days=15)
 
@@ -133,7 +147,7 @@ def find(
                 if field not in _SEARCH_FIELDS:
                     setattr(ds, field, "")
 
-            assoc = ae.associate(called_node.ip, called_node.port)
+            assoc = ae.associate(called_node.ip, called_node.port, ext_neg=ext_neg)
             try:
                 if assoc.is_established:
                     responses = assoc.send_c_find(ds, query_root)
@@ -158,6 +172,7 @@ def patient_find(
     start_date: datetime,
     end_date: datetime = None,
     modality: str = "",
+    relational: bool = False,
 ) -> Generator[Dataset, None, None]:
     """Find DICOM resources from the destination DICOM node using the
     specified DICOM criteria. Queries are made using the PATIENT
@@ -182,6 +197,9 @@ def patient_find(
         start_date parameter.
     modality : str
         If set, specify the DICOM modality to get results for.
+    relational : bool
+        If True, propose relational queries to the called node through
+        the association's extended negotiation. The default is False.
 
     Yields
     ------
@@ -204,6 +222,7 @@ def patient_find(
         start_date=start_date,
         end_date=end_date,
         modality=modality,
+        relational=relational,
     )
     for res in results:
         yield res
@@ -217,6 +236,7 @@ def study_find(
     start_date: datetime,
     end_date: datetime = None,
     modality: str = "",
+    relational: bool = False,
 ) -> Generator[Dataset, None, None]:
     """Find DICOM resources from the destination DICOM node using the
     specified DICOM criteria. Queries are made using the STUDY
@@ -241,6 +261,9 @@ def study_find(
         start_date parameter.
     modality : str
         If set, specify the DICOM modality to get results for.
+    relational : bool
+        If True, propose relational queries to the called node through
+        the association's extended negotiation. The default is False.
 
     Yields
     ------
@@ -263,6 +286,7 @@ def study_find(
         start_date=start_date,
         end_date=end_date,
         modality=modality,
+        relational=relational,
     )
     for res in results:
         yield res
@@ -277,6 +301,7 @@ def patient_find2csv(
     start_date: datetime,
     end_date: datetime = None,
     modality: str = "",
+    relational: bool = False,
 ):
     """Find DICOM resources from the destination DICOM node using the
     specified DICOM criteria. Queries are made using the PATIENT
@@ -304,6 +329,9 @@ def patient_find2csv(
         start_date parameter.
     modality : str
         If set, specify the DICOM modality to get results for.
+    relational : bool
+        If True, propose relational queries to the called node through
+        the association's extended negotiation. The default is False.
 
     Raises
     ------
@@ -324,6 +352,7 @@ def patient_find2csv(
             start_date=start_date,
             end_date=end_date,
             modality=modality,
+            relational=relational,
         )
         for result in results_generator:
             res_dict = {field: getattr(result, field) for field in fields}
@@ -339,6 +368,7 @@ def study_find2csv(
     start_date: datetime,
     end_date: datetime = None,
     modality: str = "",
+    relational: bool = False,
 ):
     """Find DICOM resources from the destination DICOM node using the
     specified DICOM criteria. Queries are made using the STUDY
@@ -366,6 +396,9 @@ def study_find2csv(
         start_date parameter.
     modality : str
         If set, specify the DICOM modality to get results for.
+    relational : bool
+        If True, propose relational queries to the called node through
+        the association's extended negotiation. The default is False.
 
     Raises
     ------
@@ -386,6 +419,7 @@ def study_find2csv(
             start_date=start_date,
             end_date=end_date,
             modality=modality,
+            relational=relational,
         )
         for result in results_generator:
             res_dict = {field: getattr(result, field) for field in fields}
@@ -401,6 +435,7 @@ def patient_find2sql(
     end_date: datetime = None,
     modality: str = "",
     create_tables: bool = False,
+    relational: bool = False,
 ):
     """Find DICOM resources from the destination DICOM node using the
     specified DICOM criteria. Queries are made using the PATIENT
@@ -428,6 +463,9 @@ def patient_find2sql(
     create_tables : bool
         If True, create the database tables before inserting the first
         find result. The default is False.
+    relational : bool
+        If True, propose relational queries to the called node through
+        the association's extended negotiation. The default is False.
 
     Raises
     ------
@@ -444,6 +482,7 @@ def patient_find2sql(
             start_date=start_date,
             end_date=end_date,
             modality=modality,
+            relational=relational,
         )
         for result in results_generator:
             add_found_study(db.conn(), result)
@@ -458,6 +497,7 @@ def study_find2sql(
     end_date: datetime = None,
     modality: str = "",
     create_tables: bool = False,
+    relational: bool = False,
 ):
     """Find DICOM resources from the destination DICOM node using the
     specified DICOM criteria. Queries are made using the STUDY
@@ -485,6 +525,9 @@ def study_find2sql(
     create_tables : bool
         If True, create the database tables before inserting the first
         find result. The default is False.
+    relational : bool
+        If True, propose relational queries to the called node through
+        the association's extended negotiation. The default is False.
 
     Raises
     ------
@@ -501,6 +544,7 @@ def study_find2sql(
             start_date=start_date,
             end_date=end_date,
             modality=modality,
+            relational=relational,
         )
         for result in results_generator:
             add_found_study(db.conn(), result)
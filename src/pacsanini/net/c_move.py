@@ -7,7 +7,7 @@ operations with a PACS node.
 """
 from datetime import time
 from time import sleep
-from typing import Any, Callable, Generator, List, Tuple, Union
+from typing import Any, Callable, Generator, Iterable, List, Tuple, Union
 
 from loguru import logger
 from pydicom.dataset import Dataset
@@ -31,7 +31,7 @@ def move(
     local_node: Union[DicomNode, dict],
     called_node: Union[DicomNode, dict],
     *,
-    resources: List[str],
+    resources: Iterable[str],
     query_level: QueryLevel,
     dest_node: Union[DicomNode, dict] = None,
     directory: str = "",
@@ -44,7 +44,7 @@ def move(
     """Move resources requested by the local_node to the
     dest_node by querying the called_node.
 
-    Resources should be a list of string values corresponding
+    Resources should be an iterable of string values corresponding
     to patient ID values (in which case the query_level should
     be set to PATIENT) or to study UID values (in which case
     the query_level should be set to STUDY).
@@ -56,8 +56,8 @@ def move(
     called_node : Union[DicomNode, dict]
         The called DICOM node that contains the the DICOM
         resources.
-    resources : List[str]
-        The list of DICOM resources to move.
+    resources : Iterable[str]
+        The DICOM resources to move.
     query_level : QueryLevel
         If the resources are study UID values, this should be
         set to STUDY. If the resources are patient ID values,
@@ -163,7 +163,7 @@ def move_studies(
     local_node: DicomNode,
     called_node: DicomNode,
     *,
-    study_uids: List[str],
+    study_uids: Iterable[str],
     dest_node: DicomNode = None,
     directory: str = "",
     sort_by: StorageSortKey = StorageSortKey.PATIENT,
@@ -182,8 +182,8 @@ def move_studies(
     called_node : DicomNode
         The called DICOM node that contains the the DICOM
         resources.
-    study_uids : List[str]
-        The list of StudyInstanceUID values to move.
+    study_uids : Iterable[str]
+        The StudyInstanceUID values to move.
     dest_node : DicomNode
         The DICOM node to move the requested resources to. If
         unset, this will be equal to the local_node.
@@ -232,7 +232,7 @@ def move_patients(
     local_node: DicomNode,
     called_node: DicomNode,
     *,
-    patient_ids: List[str],
+    patient_ids: Iterable[str],
     dest_node: DicomNode = None,
     directory: str = "",
     sort_by: StorageSortKey = StorageSortKey.PATIENT,
@@ -251,8 +251,8 @@ def move_patients(
     called_node : DicomNode
         The called DICOM node that contains the the DICOM
         resources.
-    patient_ids : List[str]
-        The list of PatientID values to move.
+    patient_ids : Iterable[str]
+        The PatientID values to move.
     dest_node : DicomNode
         The DICOM node to move the requested resources to. If
         unset, this will be equal to the local_node.
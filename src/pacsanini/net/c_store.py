@@ -29,10 +29,12 @@ def send_dicom(
     *,
     src_node: Union[DicomNode, dict],
     dest_node: Union[DicomNode, dict],
+    max_pdu: int = 16382,
 ) -> Generator[Tuple[str, Dataset], None, None]:
     """Send one or multiple DICOM files from the source node
     to the dest node. If the dcm_path is a directory, non-DICOM
-    files will be ignored.
+    files will be ignored. All the files are sent over a single
+    association.
 
     Parameters
     ----------
@@ -43,6 +45,12 @@ def send_dicom(
         The source DICOM node to use for sending the DICOM data.
     dest_node : Union[DicomNode, dict]
         The destination DICOM node to send the DICOM data to.
+    max_pdu : int
+        The maximum PDU size, in bytes, that the source node can
+        receive. This does not change the size of the PDUs that are
+        sent, which is set by the dest_node. 0 means that the size is
+        unlimited. The default is 16382, pynetdicom's default maximum
+        PDU size.
 
     Yields
     ------
@@ -76,7 +84,9 @@ def send_dicom(
 
     assoc: Association = None
     try:
-        assoc = ae.associate(dest_node.ip, dest_node.port, ae_title=dest_node.aetitle)
+        assoc = ae.associate(
+            dest_node.ip, dest_node.port, ae_title=dest_node.aetitle, max_pdu=max_pdu
+        )
         if assoc.is_established:
             for path in dcm_files:
                 try:
@@ -9,17 +9,38 @@ import json
 import re
 
 from contextlib import suppress
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 import yaml
 
 from pydantic import BaseModel, validator
 from pydicom import dcmread
+from pydicom.datadict import tag_for_keyword
 from pydicom.dataset import Dataset
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore
+
+
 _SEQUENCE = re.compile(r"\w+\[(\d)\]\w+")
+_NESTED_SEP = re.compile(r"[.\[]")
+
+# A DicomTagGroup's tags as (tag_alias, tag_names, callback, default_val) tuples.
+FrozenTags = Tuple[Tuple[str, Tuple[str, ...], Optional[Callable], Any], ...]
 
 
 def get_dicom_tag_value(
@@ -242,6 +263,28 @@ def parse_dicom(
     return results
 
 
+def parse_frozen_tags(dicom: Dataset, tags: FrozenTags) -> Dict[str, Any]:
+    """Parse a DICOM Dataset using tags obtained from DicomTagGroup.freeze.
+
+    Parameters
+    ----------
+    dicom : Dataset
+        The DICOM data to parse.
+    tags : FrozenTags
+        The frozen tags to get the values of from the DICOM data.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A dict whose keys correspond to the tag aliases
+        and whose values correspond to the DICOM tags' values.
+    """
+    return {
+        alias: get_tag_value(dicom, tag_names, callback=callback, default_val=default)
+        for alias, tag_names, callback, default in tags
+    }
+
+
 def parse_dicoms(
     dicoms: Iterable[Union[str, Dataset]], tags: Iterable[Union[dict, DicomTag]]
 ) -> Generator[Dict[str, Any], None, None]:
@@ -281,9 +324,45 @@ class DicomTagGroup(BaseModel):
     def from_yaml(cls, path: str):
         """Obtain a DicomTagGroup instance from a yaml file."""
         with open(path) as in_:
-            content = yaml.safe_load(in_.read())
+            content = yaml.load(in_, Loader=SafeLoader)
         return cls(**content)
 
+    def tag_keywords(self) -> List[str]:
+        """Return the keywords of the top-level DICOM tags needed to
+        parse the instance's tags, fallback tags included. Nested tags
+        are represented by the keyword of their top-level sequence.
+        Names that are not DICOM keywords are left out. The result can
+        be passed as the specific_tags argument of pydicom.dcmread.
+        """
+        keywords: List[str] = []
+        for tag in self.tags:
+            tag_names = (
+                [tag.tag_name] if isinstance(tag.tag_name, str) else tag.tag_name
+            )
+            for tag_name in tag_names:
+                keyword = _NESTED_SEP.split(tag_name, 1)[0]
+                if keyword not in keywords and tag_for_keyword(keyword) is not None:
+                    keywords.append(keyword)
+        return keywords
+
+    def freeze(self) -> FrozenTags:
+        """Return the instance's tags as plain tuples that can be passed
+        to parse_frozen_tags. Parsing many files with the frozen tags
+        avoids going through the pydantic models for every file and
+        makes the parser cheaper to send to worker processes.
+        """
+        return tuple(
+            (
+                str(tag.tag_alias),
+                (tag.tag_name,)
+                if isinstance(tag.tag_name, str)
+                else tuple(tag.tag_name),
+                tag.callback,
+                tag.default_val,
+            )
+            for tag in self.tags
+        )
+
     def parse_dicom(self, dicom: Union[str, Dataset]) -> Dict[str, Any]:
         """Parse a DICOM file using the instance's tags."""
         return parse_dicom(dicom, self.tags)
@@ -5,4 +5,7 @@
 """The pipeline module exposes pre-configured pipelines and tasks
 for finding, moving, and parsing DICOM files.
 """
-from pacsanini.pipeline.orchestra import run_pacsanini_pipeline
+from pacsanini.pipeline.orchestra import (
+    run_pacsanini_pipeline,
+    run_pacsanini_pipeline_inline,
+)
@@ -6,13 +6,17 @@
 for finding, moving, and parsing DICOM resources.
 """
 
-from typing import Union
+from typing import Generator, Iterable, Tuple, Union
 
 from prefect import Flow, Parameter, case, context
 from prefect.engine.state import State
+from pydicom import Dataset
 
+from pacsanini import db, io, net
 from pacsanini.config import PacsaniniConfig
+from pacsanini.db.utils import initialize_database
 from pacsanini.errors import InvalidConfigError
+from pacsanini.models import QueryLevel
 from pacsanini.pipeline.tasks import (
     check_if_database_creation_needed,
     check_if_parsing_needed,
@@ -25,6 +29,21 @@ from pacsanini.pipeline.tasks import (
 from pacsanini.utils import is_db_uri
 
 
+def _load_pipeline_config(p_config: Union[PacsaniniConfig, str]) -> PacsaniniConfig:
+    """Load the pipeline's configuration and check that it can be used
+    to find, move, and parse DICOM resources.
+    """
+    config_ = load_configuration.run(p_config)
+
+    if not config_.can_find():
+        raise InvalidConfigError("Missing find configuration.")
+    if not config_.can_move():
+        raise InvalidConfigError("Missing move configuration.")
+    if not config_.can_parse() and not is_db_uri(config_.storage.resources):
+        raise InvalidConfigError("Missing parse configuration.")
+    return config_
+
+
 def run_pacsanini_pipeline(
     p_config: Union[PacsaniniConfig, str], nb_threads: int = 1, init_db: bool = False
 ) -> State:
@@ -55,21 +74,7 @@ def run_pacsanini_pipeline(
     State
         The flow's end state.
     """
-    if isinstance(p_config, str):
-        ext = p_config.rsplit(".", 1)[-1].lower()
-        load_func = (
-            PacsaniniConfig.from_json if ext == "json" else PacsaniniConfig.from_yaml
-        )
-        config_ = load_func(p_config)
-    else:
-        config_ = p_config
-
-    if not config_.can_find():
-        raise InvalidConfigError("Missing find configuration.")
-    if not config_.can_move():
-        raise InvalidConfigError("Missing move configuration.")
-    if not config_.can_parse() and not is_db_uri(config_.storage.resources):
-        raise InvalidConfigError("Missing parse configuration.")
+    config_ = _load_pipeline_config(p_config)
 
     context["pacsanini_config"] = config_
 
@@ -97,3 +102,114 @@ def run_pacsanini_pipeline(
     return flow.run(
         config_path_param=p_config, nb_threads_param=nb_threads, init_db_param=init_db
     )
+
+
+def _iter_found_resources(
+    results: Iterable[Dataset], query_level: QueryLevel
+) -> Generator[str, None, None]:
+    """Yield the unique identifiers of C-FIND results that should be
+    moved at the given query level.
+    """
+    keyword = "PatientID" if query_level == QueryLevel.PATIENT else "StudyInstanceUID"
+    seen = set()
+    for res in results:
+        uid = getattr(res, keyword, None)
+        if uid and uid not in seen:
+            seen.add(uid)
+            yield uid
+
+
+def run_pacsanini_pipeline_inline(
+    p_config: Union[PacsaniniConfig, str], nb_threads: int = 1, init_db: bool = False
+) -> Generator[Tuple[int, str], None, None]:
+    """Run the find-move-parse pipeline without storing the C-FIND
+    results in between. Found resources are kept in memory and are
+    moved once the C-FIND queries have completed.
+
+    Unlike run_pacsanini_pipeline, found resources are not written to
+    the storage.resources backend before being moved: if the pipeline
+    is interrupted, it cannot be resumed from where it left off.
+
+    Parameters
+    ----------
+    p_config : Union[PacsaniniConfig, str]
+        The configuration file to use for the pipeline's execution.
+    nb_threads : int
+        The number of threads to use for parsing DICOM resources. This
+        is only used if the results backend is not a database. The default
+        is 1.
+    init_db : bool
+        If the results backend is a database and init_db is True, the
+        database and its tables will be created. The default is False.
+
+    Yields
+    ------
+    Tuple[int, str]
+        The C-MOVE request status and the moved UID for each resource.
+
+    Raises
+    ------
+    InvalidConfigError
+        An InvalidConfigError is raised if the configuration cannot be
+        used to find, move, and parse resources or if the find and move
+        query levels differ.
+    """
+    config = _load_pipeline_config(p_config)
+    # Found resources are moved as they are: both operations must
+    # use the same query level.
+    query_level = config.move.query_level
+    if config.find.query_level != query_level:
+        raise InvalidConfigError(
+            "The find and move configurations must use the same query level."
+        )
+
+    resources_uri = config.storage.resources
+    use_db = is_db_uri(resources_uri)
+    if init_db and use_db:
+        initialize_database(config)
+
+    # C-FIND results are collected before any C-MOVE request is sent
+    # so that no C-FIND association stays idle while resources are moved.
+    results = net.find(
+        config.net.local_node,
+        config.net.called_node,
+        query_level=config.find.query_level,
+        dicom_fields=config.find.search_fields,
+        start_date=config.find.start_date,
+        end_date=config.find.end_date,
+        modality=config.find.modality,
+    )
+    resources = list(_iter_found_resources(results, query_level))
+
+    if use_db:
+        with db.get_db_session(resources_uri) as db_session:
+            yield from net.move(
+                config.net.local_node,
+                config.net.called_node,
+                resources=resources,
+                query_level=query_level,
+                dest_node=config.net.dest_node,
+                directory=config.storage.directory,
+                sort_by=config.storage.sort_by,
+                start_time=config.move.start_time,
+                end_time=config.move.end_time,
+                db_session=db_session,
+            )
+    else:
+        yield from net.move(
+            config.net.local_node,
+            config.net.called_node,
+            resources=resources,
+            query_level=query_level,
+            dest_node=config.net.dest_node,
+            directory=config.storage.directory,
+            sort_by=config.storage.sort_by,
+            start_time=config.move.start_time,
+            end_time=config.move.end_time,
+        )
+        io.parse_dir2csv(
+            config.storage.directory,
+            config.get_tags(),
+            config.storage.resources_meta,
+            nb_threads=nb_threads,
+        )
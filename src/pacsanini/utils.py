@@ -66,24 +66,16 @@ def read_resources(resources_path: str, query_level: QueryLevel) -> List[str]:
     return resources
 
 
-SUPPORTED_DB_DIALECTS = [
-    re.compile(r"postgresql(\+[\w\d]+)?://"),
-    re.compile(r"mysql(\+[\w\d]+)?://"),
-    re.compile(r"mariadb(\+[\w\d]+)?://"),
-    re.compile(r"oracle(\+[\w\d]+)?://"),
-    re.compile(r"sqlite://"),
-]
+SUPPORTED_DB_DIALECTS = re.compile(
+    r"(?:postgresql|mysql|mariadb|oracle|sqlite)(?:\+\w+)?://", re.IGNORECASE
+)
 
 
 def is_db_uri(uri: str) -> bool:
     """Return true if the URI is for a known database. False
     otherwise (eg: it is a file path).
     """
-    uri_lower = uri.lower()
-    for dialect in SUPPORTED_DB_DIALECTS:
-        if dialect.match(uri_lower):
-            return True
-    return False
+    return SUPPORTED_DB_DIALECTS.match(uri) is not None
 
 
 def default_config_path() -> Optional[str]:
@@ -3,16 +3,24 @@
 # This file is subject to the terms and conditions described in the
 # LICENSE file distributed in this package.
 """Test that the base CLI methods and classes function correctly."""
+import json
 import os
 
 from unittest.mock import patch
 
 import pytest
+import yaml
 
-from click import command
+from click import ClickException, command, option
 from click.testing import CliRunner
 
-from pacsanini.cli.base import config_option
+from pacsanini.cli.base import (
+    GroupCommand,
+    GroupOption,
+    _load_config_cached,
+    config_option,
+    load_pacsanini_config,
+)
 from pacsanini.config import PACSANINI_CONF_ENVVAR
 
 
@@ -54,3 +62,101 @@ def test_config_option_with_implicit_value(dummy_func, pacsanini_orthanc_config)
             res = runner.invoke(dummy_func, catch_exceptions=True)
             assert "Config" in res.output
             assert res.exit_code == 0
+
+
+@pytest.mark.cli
+def test_config_option_caches_loaded_config(tmpdir):
+    """Test that loading the same unmodified configuration file twice
+    returns the cached configuration instance.
+    """
+    config_path = os.path.join(str(tmpdir), "pacsanini.yaml")
+    with open(config_path, "w") as out:
+        yaml.safe_dump(
+            {"storage": {"resources": "resources.csv", "directory": str(tmpdir)}}, out
+        )
+
+    mtime = os.path.getmtime(config_path)
+    config1 = _load_config_cached(config_path, mtime)
+    config2 = _load_config_cached(config_path, mtime)
+    assert config1 is config2
+    assert config1.storage.resources == "resources.csv"
+
+    config3 = _load_config_cached(config_path, mtime + 1)
+    assert config3 is not config1
+    assert config3 == config1
+
+
+@pytest.mark.cli
+def test_load_pacsanini_config_relative_path(tmpdir, monkeypatch):
+    """Test that the same relative path is not served from the cache
+    once the current directory changes.
+    """
+    mtime = None
+    for name in ["dir1", "dir2"]:
+        config_dir = tmpdir.mkdir(name)
+        config_path = os.path.join(str(config_dir), "pacsanini.yaml")
+        with open(config_path, "w") as out:
+            yaml.safe_dump(
+                {"storage": {"resources": f"{name}.csv", "directory": name}}, out
+            )
+        if mtime is None:
+            mtime = os.path.getmtime(config_path)
+        os.utime(config_path, (mtime, mtime))
+
+    for name in ["dir1", "dir2"]:
+        monkeypatch.chdir(os.path.join(str(tmpdir), name))
+        config = load_pacsanini_config("pacsanini.yaml")
+        assert config.storage.resources == f"{name}.csv"
+
+
+@pytest.mark.cli
+@pytest.mark.parametrize("ext", ["json", "JSON", "yaml", "yml"])
+def test_load_pacsanini_config(tmpdir, ext):
+    """Test that configuration files are loaded according to
+    their extension.
+    """
+    config_path = os.path.join(str(tmpdir), f"pacsanini.{ext}")
+    config_dict = {"storage": {"resources": "resources.csv", "directory": "dir"}}
+    with open(config_path, "w") as out:
+        if ext.lower() == "json":
+            json.dump(config_dict, out)
+        else:
+            yaml.safe_dump(config_dict, out)
+
+    config = load_pacsanini_config(config_path)
+    assert config.storage.resources == "resources.csv"
+    assert config.storage.directory == "dir"
+
+
+@pytest.mark.cli
+def test_group_command_help_sections():
+    """Test that options are listed under their help group and
+    that ungrouped options are listed under "Other Options".
+    """
+
+    @command(name="dummy", cls=GroupCommand)
+    @option("--foo", cls=GroupOption, help_group="Foo Options", help="foo help")
+    @option("--bar", help="bar help")
+    def _dummy_func(foo, bar):  # pylint: disable=unused-argument
+        pass
+
+    result = CliRunner().invoke(_dummy_func, ["--help"])
+    assert result.exit_code == 0
+    assert "Foo Options:" in result.output
+    assert "Other Options:" in result.output
+    foo_section, other_section = result.output.split("Other Options:")
+    assert "--foo" in foo_section
+    assert "--bar" in other_section
+
+
+@pytest.mark.cli
+def test_load_pacsanini_config_unknown_extension(tmpdir):
+    """Test that configuration files that are neither JSON nor
+    YAML files are rejected.
+    """
+    config_path = os.path.join(str(tmpdir), "pacsanini.txt")
+    with open(config_path, "w") as out:
+        out.write("")
+
+    with pytest.raises(ClickException):
+        load_pacsanini_config(config_path)
@@ -5,6 +5,7 @@
 """Test that the config functionalities of the pacsanini package
 can be correctly accessed from the command line.
 """
+import logging
 import socket
 
 from threading import Thread
@@ -14,7 +15,13 @@ import pytest
 
 from click.testing import CliRunner
 
-from pacsanini.cli.net import echo_cli, server_cli
+from pacsanini.cli.net import (
+    _echo_buffered,
+    _iter_in_thread,
+    _silence_pynetdicom,
+    echo_cli,
+    server_cli,
+)
 
 
 @pytest.mark.cli
@@ -28,6 +35,50 @@ def test_config_stdout(test_config_path):
     assert result_yaml.output
 
 
+@pytest.mark.cli
+def test_echo_buffered(capsys):
+    """Test that buffered lines are all written in order."""
+    _echo_buffered((f"line{i}" for i in range(10)), max_lines=3)
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [f"line{i}" for i in range(10)]
+
+
+@pytest.mark.cli
+def test_iter_in_thread():
+    """Test that items consumed in a background thread are all yielded
+    in order and that the iterable's exceptions are re-raised.
+    """
+
+    def gen():
+        yield from range(5)
+        raise ValueError("foobar")
+
+    items = []
+    with pytest.raises(ValueError):
+        for item in _iter_in_thread(gen(), maxsize=2):
+            items.append(item)
+    assert items == list(range(5))
+
+
+@pytest.mark.cli
+def test_iter_in_thread_stops_early():
+    """Test that the background thread stops and closes the iterable
+    when the caller stops consuming items before the end.
+    """
+    closed = []
+
+    def gen():
+        try:
+            yield from range(100)
+        finally:
+            closed.append(True)
+
+    items = _iter_in_thread(gen(), maxsize=2)
+    assert [next(items) for _ in range(3)] == [0, 1, 2]
+    items.close()
+    assert closed == [True]
+
+
 @pytest.mark.cli
 class TestStorescpCli:
     """Test that a storescp server can be instantiated from the command line."""
@@ -59,3 +110,13 @@ class TestStorescpCli:
         with pytest.raises(socket.error):
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.bind(("", 104))
+
+
+@pytest.mark.cli
+def test_silence_pynetdicom():
+    """Test that pynetdicom and pydicom debug messages are filtered out."""
+    _silence_pynetdicom()
+    for name in ("pynetdicom", "pydicom"):
+        logger = logging.getLogger(name)
+        assert not logger.isEnabledFor(logging.DEBUG)
+        assert logger.isEnabledFor(logging.WARNING)
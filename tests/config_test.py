@@ -13,6 +13,7 @@ import pytest
 from pydantic import ValidationError
 
 from pacsanini import config
+from pacsanini.parse import DicomTagGroup
 
 
 @pytest.mark.config
@@ -145,4 +146,19 @@ def test_pacsanini_config():
 
     pacsanini_config = config.PacsaniniConfig(**config_dict)
     assert pacsanini_config.can_find()
+    assert pacsanini_config.capabilities == frozenset({"find"})
     assert pacsanini_config.get_tags() is None
+    assert pacsanini_config.email == config.EmailConfig()
+    assert pacsanini_config.email is not config.PacsaniniConfig().email
+
+
+@pytest.mark.config
+def test_pacsanini_config_get_tags():
+    """Test that the configured tags are returned as a DicomTagGroup."""
+    pacsanini_config = config.PacsaniniConfig(
+        tags=[{"tag_name": "PatientID", "tag_alias": "patient_id", "callback": "str"}]
+    )
+    tag_group = pacsanini_config.get_tags()
+    assert isinstance(tag_group, DicomTagGroup)
+    assert tag_group.tags == pacsanini_config.tags
+    assert tag_group.tags[0].callback is str
@@ -86,6 +86,9 @@ def test_str2timedelta():
         "012345.",
         "01.123",
         "0123.45",
+        "0a58",
+        "+1",
+        "045812.12345a",
     ]
     for time_str in invalid_times:
         with pytest.raises(ValueError):
@@ -177,3 +180,18 @@ def test_dcm2dict(dicom_path: str, dicom: Dataset):
     assert isinstance(dcm, Dataset)
 
     assert dcm.SOPInstanceUID == dicom.SOPInstanceUID
+
+
+@pytest.mark.convert
+def test_dcm2dict_sequence_names():
+    """Test that the elements of nested sequences are named."""
+    code = Dataset()
+    code.CodeValue = "R-10226"
+    dcm = Dataset()
+    dcm.PatientID = "patient1"
+    dcm.StudyDate = "20011213"
+    dcm.ViewCodeSequence = [code]
+
+    dcm_dict = convert.dcm2dict(dcm)
+    assert dcm_dict["00100020"]["Name"] == "PatientId"
+    assert dcm_dict["00540220"]["Value"][0]["00080100"]["Name"] == "CodeValue"
@@ -0,0 +1,71 @@
+# Copyright (C) 2019-2020, Therapixel SA.
+# All rights reserved.
+# This file is subject to the terms and conditions described in the
+# LICENSE file distributed in this package.
+"""Test that the dashboard's callbacks return the expected values."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pacsanini.dashboard import app
+
+
+@pytest.mark.dashboard
+def test_update_query_results():
+    """Test that the counts and the bar plot are updated with the
+    results of the query matching the control card's values.
+    """
+    yearly_counts = [(2019, "foo", 1, 1, 3), (2020, "bar", 2, 3, 10)]
+    with patch.object(
+        app, "query_study_counts", return_value=(3, 4, 13, yearly_counts)
+    ) as query_mock:
+        patients, studies, images, fig = app.update_query_results(
+            "foo", "2019-01-01", None, [0, 10], [0, 100]
+        )
+
+    query_mock.assert_called_once_with(("foo",), "2019-01-01", None, (0, 10), (0, 100))
+    assert (patients, studies, images) == ("3", "4", "13")
+    assert [trace.name for trace in fig.data] == ["patients", "studies", "images"]
+    for trace, counts in zip(fig.data, ([1, 2], [1, 3], [3, 10])):
+        assert list(trace.x) == [2019, 2020]
+        assert list(trace.y) == counts
+        assert list(trace.text) == ["foo", "bar"]
+    assert fig.layout.xaxis.tick0 == 2019
+
+
+@pytest.mark.dashboard
+def test_generate_study_metadata_plot_without_counts():
+    """Test that the bar plot is emptied when no study matches."""
+    fig = app.generate_study_metadata_plot([])
+    assert len(fig.data) == 3
+    for trace in fig.data:
+        assert not trace.x
+        assert not trace.y
+
+
+@pytest.mark.dashboard
+def test_query_study_counts_cache():
+    """Test that repeated queries with the same filters are served from
+    the cache until the cache timeout elapses.
+    """
+    engine = MagicMock()
+    conn = engine.connect.return_value.__enter__.return_value
+    conn.execute.return_value.one.return_value = (1, 2, 3)
+    conn.execute.return_value.__iter__.side_effect = lambda: iter([])
+
+    app._query_study_counts.cache_clear()
+    filters = (("foo",), None, None, (0, 10), (0, 100))
+    with patch.object(app.app_env, "engine", engine), patch.object(
+        app, "monotonic", return_value=0
+    ) as monotonic_mock:
+        assert app.query_study_counts(*filters) == (1, 2, 3, [])
+        assert app.query_study_counts(*filters) == (1, 2, 3, [])
+        assert engine.connect.call_count == 1
+
+        app.query_study_counts(("bar",), None, None, (0, 10), (0, 100))
+        assert engine.connect.call_count == 2
+
+        monotonic_mock.return_value = app._CACHE_TIMEOUT
+        app.query_study_counts(*filters)
+        assert engine.connect.call_count == 3
+    app._query_study_counts.cache_clear()
@@ -55,3 +55,18 @@ def test_dcm2study_finding():
     assert study_finding.study_uid == ds.StudyInstanceUID
     assert datetime2str(study_finding.study_date) == ds.StudyDate
     assert study_finding.accession_number == ds.AccessionNumber
+
+
+@pytest.mark.db
+def test_dcm2dbmodels_without_meta(dicom_path: str, dicom: FileDataset):
+    """Test that DICOM files can be converted to database models
+    without storing their tags in the image's meta column.
+    """
+    patient, study, series, image = dcm2dbmodels(dicom_path, include_meta=False)
+
+    assert patient.patient_id == dicom.PatientID
+    assert study.study_uid == dicom.StudyInstanceUID
+    assert series.series_uid == dicom.SeriesInstanceUID
+    assert image.image_uid == dicom.SOPInstanceUID
+    assert image.manufacturer == dicom.Manufacturer
+    assert image.meta is None
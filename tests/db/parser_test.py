@@ -6,6 +6,7 @@
 import os
 
 from typing import List
+from unittest.mock import patch
 
 import pytest
 
@@ -13,8 +14,10 @@ from pydicom import FileDataset
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from pacsanini.db.crud import DBWrapper
+from pacsanini.db.dcm2model import _read_for_db
 from pacsanini.db.models import Image
-from pacsanini.db.parser import parse_dir2sql
+from pacsanini.db.parser import _ImageBatch, parse_dir2sql
 
 
 @pytest.mark.db
@@ -47,3 +50,49 @@ def test_parse_sql2db(data_dir: str, sqlite_db_path: str, dicom: FileDataset):
 
     session.close()
     engine.dispose()
+
+
+@pytest.mark.db
+def test_parse_sql2db_without_meta(data_dir: str, sqlite_db_path: str):
+    """Test that DICOM data can be persisted into the database
+    without the images' JSON metadata, in which case DICOM files
+    are only partially read.
+    """
+    with patch(
+        "pacsanini.db.parser._read_for_db", wraps=_read_for_db
+    ) as read_mock, patch("pacsanini.io.base_parser.dcmread") as dcmread_mock:
+        parse_dir2sql(data_dir, sqlite_db_path, store_meta=False)
+        dcmread_mock.assert_not_called()
+
+    engine = create_engine(sqlite_db_path)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    results: List[Image] = session.query(Image).all()
+    assert len(results) > 1
+    for result in results:
+        assert result.image_uid
+        assert result.meta is None
+    assert read_mock.call_count >= len(results)
+
+    session.close()
+    engine.dispose()
+
+
+@pytest.mark.db
+def test_image_batch_fallback(sqlite_db_path: str, dicom: FileDataset, dicom_path: str):
+    """Test that the images of a batch that cannot be inserted at once
+    are inserted one by one, skipping the ones that fail.
+    """
+    with DBWrapper(sqlite_db_path, batch_size=10) as wrapper:
+        batch = _ImageBatch(wrapper, "foobar", 10, True)
+        batch({"dicom": "missing.dcm", "dicom_path": "missing.dcm"})
+        batch({"dicom": dicom, "dicom_path": dicom_path})
+        with patch("pacsanini.db.parser.add_images", side_effect=ValueError):
+            batch.flush()
+        assert not batch.items
+
+        results: List[Image] = wrapper.conn().query(Image).all()
+        assert len(results) == 1
+        assert results[0].image_uid == dicom.SOPInstanceUID
+        assert results[0].filepath == dicom_path
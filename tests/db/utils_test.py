@@ -3,6 +3,7 @@
 # This file is subject to the terms and conditions described in the
 # LICENSE file distributed in this package.
 """Test that the utility methods for the database work as excepted."""
+import csv
 import os
 
 from datetime import datetime
@@ -95,3 +96,30 @@ def test_initialize_database(pristine_db_engine: Engine):
         views.ManufacturerView.__tablename__,
     ]
     assert set(inspector.get_view_names()) == set(expected_view_names)
+
+
+@pytest.mark.db
+def test_dump_database_in_chunks(initialized_db_url, tmpdir):
+    """Test that tables dumped in chunks smaller than the
+    table size contain all the table's rows.
+    """
+    with utils.get_db_session(initialized_db_url) as db:
+        for i in range(5):
+            db.add(
+                models.Patient(
+                    patient_id=f"patient{i}",
+                    patient_name=f"patient{i}",
+                    patient_birth_date=datetime.utcnow(),
+                    institution="foobar",
+                )
+            )
+
+    with utils.get_db_session(initialized_db_url) as db:
+        utils.dump_database(db, output=str(tmpdir), tables=["patients"], chunk_size=2)
+
+    with open(os.path.join(str(tmpdir), "patients.csv"), newline="") as in_:
+        rows = list(csv.DictReader(in_))
+    assert len(rows) == 5
+    assert sorted(row["patient_id"] for row in rows) == [
+        f"patient{i}" for i in range(5)
+    ]
@@ -16,11 +16,18 @@ from pacsanini.io.io_parsers import parse_dir2csv
 
 
 @pytest.mark.io
-def test_csv_parser(tmp_path, data_dir, tag_group):
-    """Test that parsing DICOM files to CSV yields correct results."""
+@pytest.mark.parametrize("nb_procs", [0, 2])
+def test_csv_parser(tmp_path, data_dir, tag_group, nb_procs):
+    """Test that parsing DICOM files to CSV yields correct results,
+    whether threads or processes are used.
+    """
     dest_path = str(tmp_path.joinpath("results.csv"))
     parse_dir2csv(
-        os.path.join(data_dir, "dicom-files"), tag_group, dest_path, include_path=True
+        os.path.join(data_dir, "dicom-files"),
+        tag_group,
+        dest_path,
+        include_path=True,
+        nb_procs=nb_procs,
     )
 
     assert os.path.exists(dest_path)
@@ -161,3 +161,42 @@ def test_dicom_tag_group(data_dir: str):
     assert isinstance(tag_group_yaml, parse.DicomTagGroup)
 
     assert tag_group_json == tag_group_yaml
+
+
+@pytest.mark.parse
+def test_dicom_tag_group_tag_keywords():
+    """Test that the top-level keywords of the tags to parse are
+    returned once and that invalid keywords are left out.
+    """
+    tag_group = parse.DicomTagGroup(
+        tags=[
+            {"tag_name": ["FooBar", "PatientID"]},
+            {"tag_name": "ViewCodeSequence.CodeValue"},
+            {"tag_name": "ViewCodeSequence[1]CodeMeaning"},
+            {"tag_name": "PatientID", "tag_alias": "patient_id"},
+        ]
+    )
+    assert tag_group.tag_keywords() == ["PatientID", "ViewCodeSequence"]
+
+
+@pytest.mark.parse
+def test_dicom_tag_group_freeze():
+    """Test that frozen tags parse DICOM data like the tag group does."""
+    dcm = pydicom.Dataset()
+    dcm.PatientID = "foo"
+    dcm.PatientAge = "040Y"
+
+    tag_group = parse.DicomTagGroup(
+        tags=[
+            {"tag_name": ["FooBar", "PatientID"], "tag_alias": "patient_id"},
+            {"tag_name": "PatientAge", "callback": "str"},
+            {"tag_name": "StudyDate", "default_val": "19700101"},
+        ]
+    )
+    frozen = tag_group.freeze()
+    assert frozen == (
+        ("patient_id", ("FooBar", "PatientID"), None, None),
+        ("PatientAge", ("PatientAge",), str, None),
+        ("StudyDate", ("StudyDate",), None, "19700101"),
+    )
+    assert parse.parse_frozen_tags(dcm, frozen) == tag_group.parse_dicom(dcm)
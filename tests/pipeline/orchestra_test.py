@@ -7,9 +7,17 @@ import os
 
 import pytest
 
+from pydicom import Dataset
+
 from pacsanini.config import PacsaniniConfig
 from pacsanini.db import Image, utils
+from pacsanini.errors import InvalidConfigError
+from pacsanini.models import QueryLevel
 from pacsanini.pipeline import run_pacsanini_pipeline
+from pacsanini.pipeline.orchestra import (
+    _iter_found_resources,
+    run_pacsanini_pipeline_inline,
+)
 
 
 @pytest.mark.pipeline
@@ -29,3 +37,62 @@ def test_run_pacsanini_pipeline(pacsanini_orthanc_config: str):
         db_images = db_session.query(Image).all()
         assert len(db_images)
         assert len(db_images) == file_count
+
+
+@pytest.mark.pipeline
+def test_iter_found_resources():
+    """Test that found resources are deduplicated at the move query level."""
+    results = []
+    for patient_id, study_uid in [("p1", "1.1"), ("p1", "1.2"), ("p2", "1.1")]:
+        ds = Dataset()
+        ds.PatientID = patient_id
+        ds.StudyInstanceUID = study_uid
+        results.append(ds)
+    results.append(Dataset())
+
+    assert list(_iter_found_resources(results, QueryLevel.STUDY)) == ["1.1", "1.2"]
+    assert list(_iter_found_resources(results, QueryLevel.PATIENT)) == ["p1", "p2"]
+
+
+@pytest.mark.pipeline
+def test_run_pacsanini_pipeline_inline_query_levels():
+    """Test that the inline pipeline refuses to move resources found
+    at another query level.
+    """
+    node = {"aetitle": "foobar", "ip": "127.0.0.1", "port": 11112}
+    config = PacsaniniConfig(
+        net={"local_node": node, "called_node": node},
+        find={"query_level": QueryLevel.PATIENT, "start_date": "20200101"},
+        move={"query_level": QueryLevel.STUDY},
+        storage={"resources": "sqlite:///foobar.db", "directory": "dcmdir"},
+    )
+    with pytest.raises(InvalidConfigError):
+        next(run_pacsanini_pipeline_inline(config))
+
+
+@pytest.mark.pipeline
+def test_run_pacsanini_pipeline_inline(
+    pacsanini_orthanc_config: str, dicom: Dataset, tmpdir
+):
+    """Test that the inline pipeline moves the resources it finds."""
+    config = PacsaniniConfig.from_yaml(pacsanini_orthanc_config)
+    config.storage.resources = f"sqlite:///{os.path.join(str(tmpdir), 'inline.db')}"
+    config.storage.directory = os.path.join(str(tmpdir), "dcmdir")
+
+    moved_uids = {uid for _, uid in run_pacsanini_pipeline_inline(config, init_db=True)}
+    assert moved_uids == {dicom.StudyInstanceUID}
+
+    expected_path = os.path.join(
+        config.storage.directory,
+        dicom.PatientID,
+        dicom.StudyInstanceUID,
+        dicom.SeriesInstanceUID,
+        f"{dicom.SOPInstanceUID}.dcm",
+    )
+    assert os.path.exists(expected_path)
+
+    with utils.get_db_session(config.storage.resources) as db_session:
+        db_image = db_session.query(Image).filter(
+            Image.image_uid == dicom.SOPInstanceUID
+        )
+        assert db_image.count() == 1